@@ -0,0 +1,80 @@
+"""Compare dataclasses_json's `from_dict` with the specialised decoders on recorded payloads.
+
+The payloads are the ones recorded in the match store by the bot, run from within src:
+
+    python -m benchmarks.decoders [path to the match store] [--rounds N]
+"""
+
+import argparse
+import sqlite3
+import time
+import zlib
+import json
+from typing import Any, Callable, Dict, List
+
+from cogs.riot_api_utilities.api_dataclasses.decoders import (
+    decode_match,
+    decode_match_timeline,
+)
+from cogs.riot_api_utilities.api_dataclasses.match import Match
+from cogs.riot_api_utilities.api_dataclasses.match_timeline import MatchTimeline
+from cogs.riot_api_utilities.constants import MATCH_STORE_PATH
+
+
+def load_payloads(path: str, table: str, limit: int) -> List[Dict[str, Any]]:
+    connection = sqlite3.connect(path)
+    rows = connection.execute(f"SELECT data FROM {table} LIMIT ?", (limit,)).fetchall()
+    connection.close()
+    return [json.loads(zlib.decompress(data)) for (data,) in rows]
+
+
+def measure(decoder: Callable[[Dict[str, Any]], Any], payloads, rounds: int) -> float:
+    """Average time in milliseconds, spent on decoding a single payload"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for payload in payloads:
+            decoder(payload)
+    return (time.perf_counter() - start) / (rounds * len(payloads)) * 1000
+
+
+def compare(name: str, reference, fast, payloads, rounds: int) -> None:
+    if not payloads:
+        print(f"{name}: no recorded payloads in the store")
+        return
+
+    for payload in payloads:
+        assert fast(payload) == reference(payload), "decoders disagree"
+
+    reference_time = measure(reference, payloads, rounds)
+    fast_time = measure(fast, payloads, rounds)
+    print(
+        f"{name} ({len(payloads)} payloads): from_dict {reference_time:.2f} ms, "
+        f"specialised {fast_time:.2f} ms, {reference_time / fast_time:.1f}x faster"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("store", nargs="?", default=MATCH_STORE_PATH)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    compare(
+        "Match",
+        Match.from_dict,
+        decode_match,
+        load_payloads(args.store, "matches", args.limit),
+        args.rounds,
+    )
+    compare(
+        "MatchTimeline",
+        MatchTimeline.from_dict,
+        decode_match_timeline,
+        load_payloads(args.store, "timelines", args.limit),
+        args.rounds,
+    )
+
+
+if __name__ == "__main__":
+    main()
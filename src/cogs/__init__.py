@@ -1 +1 @@
-from .riot_api_utilities.riot_api import RiotApi
\ No newline at end of file
+from .riot_api_utilities.async_riot_api import AsyncRiotApi
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""Running aggregates of summoners, updated one match at a time.
+
+Every stat keeps its count, mean and sum of squared deviations (Welford's algorithm), so
+averages and variances over a whole history are read in O(1), however long it gets.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .api_dataclasses.match_stats import MatchStats
+
+# Stats aggregated for every participant of every stored match
+AGGREGATED_STATS: Tuple[str, ...] = (
+    "kills",
+    "deaths",
+    "assists",
+    "kda",
+    "kill_participation",
+    "damage_per_minute",
+    "gold_per_minute",
+    "cs_per_minute",
+    "vision_score",
+    "vision_score_per_minute",
+)
+
+
+@dataclass
+class RunningStat:
+    """Count, mean and sum of squared deviations of a stat, as Welford's algorithm keeps them"""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.count
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, NaN below two values"""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+@dataclass
+class ChampionRecord:
+    games: int = 0
+    wins: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games * 100 if self.games else math.nan
+
+
+@dataclass
+class SummonerAggregates:
+    """Everything aggregated over the stored matches of a summoner"""
+
+    puuid: str
+    games: int = 0
+    wins: int = 0
+    stats: Dict[str, RunningStat] = field(default_factory=dict)
+    champions: Dict[str, ChampionRecord] = field(default_factory=dict)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games * 100 if self.games else math.nan
+
+    def stat(self, name: str) -> RunningStat:
+        return self.stats.setdefault(name, RunningStat())
+
+    def top_champions(self, count: int = 3) -> List[Tuple[str, ChampionRecord]]:
+        """Most played champions, with their records"""
+        return sorted(
+            self.champions.items(), key=lambda item: item[1].games, reverse=True
+        )[:count]
+
+
+@dataclass
+class ParticipantResult:
+    """Values a single match adds to the aggregates of one of its participants"""
+
+    puuid: str
+    champion: str
+    win: bool
+    values: Dict[str, float]
+
+
+@dataclass
+class LeaderboardEntry:
+    """A summoner's place on a leaderboard of a single stat"""
+
+    name: str
+    games: int
+    stat: RunningStat
+
+
+def participant_results(stats: MatchStats) -> Iterator[ParticipantResult]:
+    """Results of every participant, out of `MatchStats.of_participants` of a match
+
+    Stats riot did not send are skipped.
+    """
+    columns = {
+        "kda": stats.kda,
+        "kill_participation": stats.kill_participation,
+        "damage_per_minute": stats.per_minute("total_damage_dealt_to_champions"),
+        "gold_per_minute": stats.per_minute("gold_earned"),
+        "cs_per_minute": stats.per_minute(
+            stats["total_minions_killed"] + stats["neutral_minions_killed"]
+        ),
+        "vision_score_per_minute": stats.per_minute("vision_score"),
+    }
+
+    for index, row in enumerate(stats.records):
+        if not row["puuid"]:
+            continue
+        values = {}
+        for name in AGGREGATED_STATS:
+            value = float(columns[name][index] if name in columns else row[name])
+            if not np.isnan(value):
+                values[name] = value
+        yield ParticipantResult(
+            row["puuid"],
+            row["champion_name"],
+            bool(row["win"]),
+            values,
+        )
+
+
+def empty_aggregates(puuid: str) -> SummonerAggregates:
+    return SummonerAggregates(
+        puuid, stats={name: RunningStat() for name in AGGREGATED_STATS}
+    )
+
+
+def add_result(
+    aggregates: Optional[SummonerAggregates], result: ParticipantResult
+) -> SummonerAggregates:
+    """Fold a participant's result of a match into their aggregates"""
+    aggregates = aggregates or empty_aggregates(result.puuid)
+    aggregates.games += 1
+    aggregates.wins += result.win
+    for name, value in result.values.items():
+        aggregates.stat(name).add(value)
+
+    champion = aggregates.champions.setdefault(result.champion, ChampionRecord())
+    champion.games += 1
+    champion.wins += result.win
+    return aggregates
@@ -1,33 +1,37 @@
-from os import name
-from typing import Dict, List 
+import json
+import pickle
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 
 from dataclasses import dataclass, field
 from dataclasses_json import dataclass_json, config
+import ijson
 
 
 @dataclass_json
 @dataclass
 class Stats:
-    hp: int
-    hpperlevel: int
-    mp: int
-    mpperlevel: int
-    movespeed: int
-    armor: int
-    armorperlevel: int
-    spellblock: int
-    spellblockperlevel: int
-    attackrange: int
-    hpregen: int
-    hpregenperlevel: int
-    mpregen: int
-    mpregenperlevel: int
-    crit: int
-    critperlevel: int
-    attackdamage: int
-    attackdamageperlevel: int
-    attackspeedperlevel: int
-    attackspeed: int
+    hp: float
+    hpperlevel: float
+    mp: float
+    mpperlevel: float
+    movespeed: float
+    armor: float
+    armorperlevel: float
+    spellblock: float
+    spellblockperlevel: float
+    attackrange: float
+    hpregen: float
+    hpregenperlevel: float
+    mpregen: float
+    mpregenperlevel: float
+    crit: float
+    critperlevel: float
+    attackdamage: float
+    attackdamageperlevel: float
+    attackspeedperlevel: float
+    attackspeed: float
 
 
 @dataclass_json
@@ -76,12 +80,107 @@ class ChampionData:
     data: Dict[str, Champion]
 
 
-from pathlib import Path
-import json
+CHAMPION_DATA_PATH = Path(__file__).parent / "champion_data.json"
+
+
+def data_version(path: Path) -> str:
+    """Patch version of a Data Dragon file, read from its header without parsing the rest"""
+    with open(path, "rb") as f:
+        return next(ijson.items(f, "version"))
+
+
+class ChampionCatalogue:
+    """Champions of a patch, indexed by numeric key, id and name.
+
+    Riot's endpoints refer to champions by their numeric key (`champion_id` of a participant),
+    Data Dragon's urls by their id ("MonkeyKing") and people by their name ("Wukong").
+    Ids and names are looked up case insensitively.
+    """
+
+    def __init__(self, champion_data: ChampionData) -> None:
+        self.data = champion_data
+        self.version = champion_data.version
+        champions = champion_data.data.values()
+        self._by_key: Dict[int, Champion] = {int(c.key): c for c in champions}
+        self._by_id: Dict[str, Champion] = {c.id.lower(): c for c in champions}
+        self._by_name: Dict[str, Champion] = {c.name.lower(): c for c in champions}
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def __iter__(self) -> Iterator[Champion]:
+        return iter(self._by_key.values())
+
+    @classmethod
+    def load(cls, path: Path = CHAMPION_DATA_PATH) -> "ChampionCatalogue":
+        """Load a catalogue from a Data Dragon champion.json
+
+        The decoded catalogue is pickled next to the json, and reused for as long as the
+        version in the json's header matches the pickled one.
+
+        Args:
+        -----
+            path (Path): A path of the json. Defaults to the bundled one.
+
+        Returns:
+        --------
+            ChampionCatalogue: Champions of the json's patch
+        """
+        version = data_version(path)
+        cache_path = path.with_suffix(".pickle")
+        try:
+            with open(cache_path, "rb") as f:
+                catalogue = pickle.load(f)
+            if isinstance(catalogue, cls) and catalogue.version == version:
+                return catalogue
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+
+        # Imported here, as decoders import the match dataclasses, which champions do not need
+        from .decoders import build_decoder
+
+        with open(path, encoding="utf8") as f:
+            catalogue = cls(build_decoder(ChampionData)(json.load(f)))
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump(catalogue, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            # A read-only install just decodes the json on every start
+            pass
+        return catalogue
+
+    def by_key(self, key: int) -> Optional[Champion]:
+        """A champion by its numeric key, e.g. 266, as in `champion_id` of a participant"""
+        return self._by_key.get(int(key))
+
+    def by_id(self, champion_id: str) -> Optional[Champion]:
+        """A champion by its Data Dragon id, e.g. "MonkeyKing" """
+        return self._by_id.get(champion_id.lower())
+
+    def by_name(self, name: str) -> Optional[Champion]:
+        """A champion by its display name, e.g. "Wukong" """
+        return self._by_name.get(name.lower())
+
+
+_catalogue: Optional[ChampionCatalogue] = None
+_catalogue_lock = threading.Lock()
+
+
+def champion_catalogue() -> ChampionCatalogue:
+    """The catalogue of the bundled champion data, loaded on first use"""
+    global _catalogue
+    if _catalogue is None:
+        with _catalogue_lock:
+            if _catalogue is None:
+                _catalogue = ChampionCatalogue.load()
+    return _catalogue
 
-with open(f"{Path(__file__).parent}/champion_data.json", encoding='utf8') as f:
-    champions = json.load(f)
 
-champions_data = ChampionData.from_dict(champions)
+def __getattr__(name: str):
+    # `champions_data` used to be decoded at import time, it is now loaded on first access
+    if name == "champions_data":
+        return champion_catalogue().data
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = ["champion_data"]
+
+__all__ = ["ChampionCatalogue", "champion_catalogue", "champions_data"]
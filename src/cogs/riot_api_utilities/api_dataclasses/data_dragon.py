@@ -0,0 +1,190 @@
+"""Data Dragon static data, kept for several patches side by side.
+
+Every patch lives in a directory of its own, `<DATA_DRAGON_PATH>/<version>/champion.json`,
+downloaded from Data Dragon on first use. A patch is decoded once per process (and pickled
+next to its json, see `ChampionCatalogue.load`), then shared by all the lookups.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import requests
+
+from ..constants import (
+    DATA_DRAGON_LOCALE,
+    DATA_DRAGON_PATH,
+    DATA_DRAGON_URL,
+    DATA_DRAGON_VERSIONS_URL,
+)
+from .champion import ChampionCatalogue, champion_catalogue
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_TIMEOUT = 10
+# Seconds before a patch, which could not be downloaded, is tried again
+DOWNLOAD_RETRY = 5 * 60
+# Seconds the newest version is trusted for, before asking Data Dragon again
+LATEST_VERSION_TTL = 60 * 60
+
+
+def patch_version(game_version: str) -> str:
+    """Data Dragon version of a game version, e.g. 14.3.561.5467 -> 14.3.1"""
+    major, minor, *_ = game_version.split(".")
+    return f"{major}.{minor}.1"
+
+
+class DataDragon:
+    """A local store of Data Dragon champion data, one catalogue per patch
+
+    Patches which cannot be downloaded fall back to the bundled catalogue, so a lookup
+    never fails, it is just less accurate for patches the bot has no data of. The fallback
+    is not kept, the download is tried again DOWNLOAD_RETRY seconds later.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path] = DATA_DRAGON_PATH,
+        locale: str = DATA_DRAGON_LOCALE,
+    ) -> None:
+        self.root = Path(root)
+        self.locale = locale
+        self._catalogues: Dict[str, ChampionCatalogue] = {}
+        # Monotonic times of the last failed downloads, by version
+        self._failures: Dict[str, float] = {}
+        # The newest version, and the monotonic time it has to be checked again at
+        self._latest: Optional[Tuple[str, float]] = None
+        self._lock = threading.Lock()
+
+    # -------------------------------------------PRIVATE-----------------------------------------------
+
+    def _download(self, version: str, path: Path) -> bool:
+        """Download champion.json of a patch, True if it succeeded"""
+        url = f"{DATA_DRAGON_URL}/{version}/data/{self.locale}/champion.json"
+        try:
+            response = requests.get(url, timeout=DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+        except requests.RequestException as error:
+            logger.warning("Champion data of patch %s unavailable: %s", version, error)
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and moved in place, so no reader ever sees half of a file
+        partial = path.with_suffix(".part")
+        partial.write_bytes(response.content)
+        os.replace(partial, path)
+        return True
+
+    def _fetch_latest_version(self) -> Optional[str]:
+        """Ask Data Dragon for the newest version, None if it did not answer"""
+        try:
+            response = requests.get(DATA_DRAGON_VERSIONS_URL, timeout=DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            return response.json()[0]
+        except (requests.RequestException, ValueError, IndexError) as error:
+            logger.warning("Latest Data Dragon version unavailable: %s", error)
+            return None
+
+    def _load(self, version: str) -> Optional[ChampionCatalogue]:
+        """Load a patch, downloading it if needed, None if it is unavailable"""
+        bundled = champion_catalogue()
+        if bundled.version == version:
+            return bundled
+
+        path = self.root / version / "champion.json"
+        if path.exists() or self._download(version, path):
+            return ChampionCatalogue.load(path)
+        return None
+
+    # -------------------------------------------PUBLIC---------------------------------------------------
+
+    def champions(self, version: Optional[str] = None) -> ChampionCatalogue:
+        """Champions of a patch, loaded (and downloaded, if needed) on first use
+
+        Args:
+        -----
+            version (Optional[str]): A Data Dragon version, e.g. 14.3.1, or a game version,
+            e.g. 14.3.561.5467. Defaults to the bundled patch.
+
+        Returns:
+        --------
+            ChampionCatalogue: Champions of the patch
+        """
+        if version is None:
+            return champion_catalogue()
+
+        version = patch_version(version)
+        catalogue = self._catalogues.get(version)
+        if catalogue is not None:
+            return catalogue
+
+        with self._lock:
+            catalogue = self._catalogues.get(version)
+            failed_at = self._failures.get(version)
+            if catalogue is None and (
+                failed_at is None or time.monotonic() - failed_at >= DOWNLOAD_RETRY
+            ):
+                catalogue = self._load(version)
+                if catalogue is None:
+                    self._failures[version] = time.monotonic()
+                else:
+                    self._catalogues[version] = catalogue
+                    self._failures.pop(version, None)
+        if catalogue is not None:
+            return catalogue
+
+        bundled = champion_catalogue()
+        logger.warning(
+            "Using champion data of patch %s for %s", bundled.version, version
+        )
+        return bundled
+
+    def latest_version(self) -> str:
+        """The newest version, which live games are played on, checked once an hour
+
+        Until Data Dragon answers, the last known version is used, or the bundled one.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._latest is not None and now < self._latest[1]:
+                return self._latest[0]
+
+            version = self._fetch_latest_version()
+            if version is not None:
+                self._latest = (version, now + LATEST_VERSION_TTL)
+            elif self._latest is not None:
+                self._latest = (self._latest[0], now + DOWNLOAD_RETRY)
+            else:
+                self._latest = (champion_catalogue().version, now + DOWNLOAD_RETRY)
+            return self._latest[0]
+
+    def loaded(self, version: Optional[str] = None) -> ChampionCatalogue:
+        """Champions of a patch if it is loaded already, the bundled ones otherwise
+
+        Never downloads nor decodes a patch, so it is safe to call on the event loop. Await
+        `champions_async` first to have the patch loaded.
+        """
+        catalogue = self._catalogues.get(patch_version(version)) if version else None
+        return catalogue or champion_catalogue()
+
+    async def champions_async(self, version: Optional[str] = None) -> ChampionCatalogue:
+        """`champions`, downloading and decoding outside of the event loop"""
+        catalogue = self._catalogues.get(patch_version(version)) if version else None
+        if catalogue is not None:
+            return catalogue
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.champions, version)
+
+    async def latest_champions(self) -> ChampionCatalogue:
+        """Champions of the newest patch, e.g. of a live game, loaded outside of the event loop"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, lambda: self.champions(self.latest_version())
+        )
+
+
+data_dragon = DataDragon()
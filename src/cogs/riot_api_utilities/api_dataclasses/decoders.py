@@ -0,0 +1,110 @@
+"""Specialised decoders for riot's payloads.
+
+`from_dict` of dataclasses_json resolves every field through reflection on each call,
+which for a match (10 participants, ~150 fields each) costs about as much as the download.
+The decoders below are generated once per dataclass, straight from its fields, and build
+the very same objects. Keys missing from a payload become None (or the field's default),
+keys unknown to the dataclass are ignored.
+"""
+
+import dataclasses
+from typing import Any, Callable, Dict, List, Type, TypeVar, Union, get_type_hints
+
+from .match import Match, Participant, Team
+from .match_timeline import MatchTimeline
+
+T = TypeVar("T")
+
+_decoders: Dict[type, Callable[[Dict[str, Any]], Any]] = {}
+
+
+def json_key(cls: type, field: dataclasses.Field) -> str:
+    """Name of the json key of a field, resolved the way dataclasses_json does it"""
+    config = {
+        **(getattr(cls, "dataclass_json_config", None) or {}),
+        **field.metadata.get("dataclasses_json", {}),
+    }
+    letter_case = config.get("letter_case")
+    return letter_case(field.name) if letter_case else field.name
+
+
+def _unwrap_optional(field_type: Any) -> Any:
+    if getattr(field_type, "__origin__", None) is Union:
+        args = [arg for arg in field_type.__args__ if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return field_type
+
+
+def _expression(field_type: Any, value: str, namespace: Dict[str, Any]) -> str:
+    """Python expression decoding `value` into `field_type`, or `value` if it needs no decoding"""
+    field_type = _unwrap_optional(field_type)
+
+    if dataclasses.is_dataclass(field_type):
+        name = f"_decode_{field_type.__name__}_{id(field_type)}"
+        namespace[name] = build_decoder(field_type)
+        return f"{name}({value})"
+
+    if getattr(field_type, "__origin__", None) in (list, List):
+        (item_type,) = field_type.__args__
+        item = _expression(item_type, "item", namespace)
+        if item != "item":
+            return f"[{item} for item in {value}]"
+
+    if getattr(field_type, "__origin__", None) in (dict, Dict):
+        _, item_type = field_type.__args__
+        item = _expression(item_type, "item", namespace)
+        if item != "item":
+            return f"{{key: {item} for key, item in {value}.items()}}"
+
+    return value
+
+
+def build_decoder(cls: Type[T]) -> Callable[[Dict[str, Any]], T]:
+    """Generate a decoder of a payload into a dataclass, nested dataclasses included
+
+    Args:
+    -----
+        cls (Type[T]): A dataclass decorated with dataclass_json
+
+    Returns:
+    --------
+        Callable[[Dict[str, Any]], T]: A function building `cls` from a payload
+    """
+    if cls in _decoders:
+        return _decoders[cls]
+
+    hints = get_type_hints(cls)
+    namespace: Dict[str, Any] = {"_cls": cls}
+    arguments = []
+
+    for index, field in enumerate(dataclasses.fields(cls)):
+        default = f"_default_{index}"
+        namespace[default] = (
+            None if field.default is dataclasses.MISSING else field.default
+        )
+        getter = f"get({json_key(cls, field)!r}, {default})"
+
+        expression = _expression(hints[field.name], "value", namespace)
+        if expression == "value":
+            arguments.append(getter)
+        else:
+            arguments.append(f"None if (value := {getter}) is None else {expression}")
+
+    source = (
+        f"def decode(data):\n"
+        f"    get = data.get\n"
+        f"    return _cls(\n        " + ",\n        ".join(arguments) + ",\n    )\n"
+    )
+    exec(compile(source, f"<decoder of {cls.__qualname__}>", "exec"), namespace)
+
+    _decoders[cls] = namespace["decode"]
+    return _decoders[cls]
+
+
+decode_match: Callable[[Dict[str, Any]], Match] = build_decoder(Match)
+decode_participant: Callable[[Dict[str, Any]], Participant] = build_decoder(Participant)
+decode_team: Callable[[Dict[str, Any]], Team] = build_decoder(Team)
+decode_match_timeline: Callable[[Dict[str, Any]], MatchTimeline] = build_decoder(
+    MatchTimeline
+)
@@ -0,0 +1,130 @@
+import dataclasses
+from typing import Any, Dict, List, Optional, Sequence, overload
+
+from .decoders import (
+    build_decoder,
+    decode_match,
+    decode_participant,
+    decode_team,
+    json_key,
+)
+from .champion import ChampionCatalogue
+from .data_dragon import DataDragon, data_dragon
+from .match import Info, Match, Metadata, Participant
+
+decode_metadata = build_decoder(Metadata)
+
+# Json keys of the fields of Info, which are returned as they are
+_INFO_KEYS: Dict[str, str] = {
+    field.name: json_key(Info, field) for field in dataclasses.fields(Info)
+}
+
+
+class LazyParticipants(Sequence[Participant]):
+    """Participants of a match, each decoded only when accessed for the first time"""
+
+    __slots__ = ("_payloads", "_participants")
+
+    def __init__(self, payloads: List[Dict[str, Any]]) -> None:
+        self._payloads = payloads
+        self._participants: List[Optional[Participant]] = [None] * len(payloads)
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    @overload
+    def __getitem__(self, index: int) -> Participant: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Participant]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        participant = self._participants[index]
+        if participant is None:
+            participant = decode_participant(self._payloads[index])
+            self._participants[index] = participant
+        return participant
+
+    def puuid_at(self, index: int) -> Optional[str]:
+        return self._payloads[index].get("puuid")
+
+    def index_of(self, puuid: str) -> Optional[int]:
+        """Position of a participant, found on the raw payloads, without decoding any"""
+        for index, payload in enumerate(self._payloads):
+            if payload.get("puuid") == puuid:
+                return index
+        return None
+
+
+class LazyInfo:
+    """`Info` of a match, reading plain fields straight from the payload"""
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self._payload = payload
+        self.participants = LazyParticipants(payload.get("participants", []))
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in _INFO_KEYS:
+            raise AttributeError(name)
+
+        if name == "teams":
+            value = [decode_team(team) for team in self._payload.get("teams", [])]
+        else:
+            value = self._payload.get(_INFO_KEYS[name])
+        # Cached on the instance, so __getattr__ is not called for it again
+        setattr(self, name, value)
+        return value
+
+
+class LazyMatch:
+    """A view of a match, which keeps the raw payload and decodes only what gets accessed.
+
+    Quacks like `Match` (`match.metadata`, `match.info.participants`, ...), but a chart
+    interested in a single summoner decodes just their `Participant` with `participant_for`.
+    What it saves is the decoding, not memory: the raw payload stays alive for as long as
+    the view does, next to whatever got decoded out of it.
+    """
+
+    __slots__ = ("payload", "metadata", "info")
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self.payload = payload
+        self.metadata: Metadata = decode_metadata(payload.get("metadata", {}))
+        self.info = LazyInfo(payload.get("info", {}))
+
+    def participant_for(self, puuid: str) -> Optional[Participant]:
+        """Participant of a summoner, looked up through `metadata.participants`
+
+        Args:
+        -----
+            puuid (str): A PUUID of a summoner
+
+        Returns:
+        --------
+            Optional[Participant]: The summoner's participant, None if they did not play the match
+        """
+        participants = self.info.participants
+        puuids = self.metadata.participants or []
+        index = puuids.index(puuid) if puuid in puuids else None
+
+        # metadata lists participants in the same order, but do not trust it blindly
+        if index is None or index >= len(participants):
+            index = participants.index_of(puuid)
+        elif participants.puuid_at(index) != puuid:
+            index = participants.index_of(puuid)
+
+        return None if index is None else participants[index]
+
+    def champions(self, store: Optional[DataDragon] = None) -> ChampionCatalogue:
+        """Champion data of the patch the match was played on, if it is loaded already
+
+        Await `DataDragon.champions_async` of `info.game_version` first to have it loaded.
+        """
+        return (store or data_dragon).loaded(self.info.game_version)
+
+    def to_match(self) -> Match:
+        """Decode the whole match"""
+        return decode_match(self.payload)
@@ -3,6 +3,9 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json, LetterCase
 
+from .champion import ChampionCatalogue
+from .data_dragon import DataDragon, data_dragon
+
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass()
@@ -244,6 +247,13 @@ class Match:
     metadata: Metadata
     info: Info
 
+    def champions(self, store: Optional[DataDragon] = None) -> ChampionCatalogue:
+        """Champion data of the patch the match was played on, if it is loaded already
+
+        Await `DataDragon.champions_async` of `info.game_version` first to have it loaded.
+        """
+        return (store or data_dragon).loaded(self.info.game_version)
+
 
 @dataclass_json
 @dataclass()
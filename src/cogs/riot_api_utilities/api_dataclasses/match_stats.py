@@ -0,0 +1,359 @@
+import dataclasses
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    get_type_hints,
+)
+
+import numpy as np
+
+from .decoders import json_key
+from .lazy_match import LazyMatch
+from .match import Info, Match, Objectives, Participant, Team
+
+_PARTICIPANT_HINTS = get_type_hints(Participant)
+# Participant's fields by their kind, each kind a column of its own dtype
+PARTICIPANT_NUMBERS: Tuple[str, ...] = tuple(
+    name for name, hint in _PARTICIPANT_HINTS.items() if hint in (int, float)
+)
+PARTICIPANT_FLAGS: Tuple[str, ...] = tuple(
+    name for name, hint in _PARTICIPANT_HINTS.items() if hint is bool
+)
+PARTICIPANT_LABELS: Tuple[str, ...] = tuple(
+    name for name, hint in _PARTICIPANT_HINTS.items() if hint is str
+)
+MATCH_NUMBERS: Tuple[str, ...] = (
+    "game_creation",
+    "game_start_timestamp",
+    "game_duration",
+    "queue_id",
+)
+# Totals of the summoner's team, summed up from the participant field they are named after
+TEAM_TOTALS: Dict[str, str] = {
+    "team_damage": "total_damage_dealt_to_champions",
+    "team_damage_taken": "total_damage_taken",
+    "team_gold": "gold_earned",
+    "team_vision_score": "vision_score",
+}
+# Whether the summoner's team took the first of an objective, by the objective of `Objectives`
+TEAM_FIRSTS: Dict[str, str] = {
+    "first_blood": "champion",
+    "first_tower": "tower",
+    "first_dragon": "dragon",
+    "first_rift_herald": "rift_herald",
+    "first_baron": "baron",
+    "first_inhibitor": "inhibitor",
+}
+
+DTYPE = np.dtype(
+    [("match_id", "O")]
+    + [(name, "f8") for name in MATCH_NUMBERS]
+    + [(name, "f8") for name in PARTICIPANT_NUMBERS]
+    + [(name, "?") for name in PARTICIPANT_FLAGS]
+    + [(name, "O") for name in PARTICIPANT_LABELS]
+    + [("team_kills", "f8")]
+    + [(name, "?") for name in TEAM_FIRSTS]
+    + [(name, "f8") for name in TEAM_TOTALS]
+)
+
+_PARTICIPANT_KEYS = {
+    field.name: json_key(Participant, field)
+    for field in dataclasses.fields(Participant)
+}
+_INFO_KEYS = {field.name: json_key(Info, field) for field in dataclasses.fields(Info)}
+_PARTICIPANT_NAMES = {name: name for name in _PARTICIPANT_KEYS}
+_INFO_NAMES = {name: name for name in _INFO_KEYS}
+_OBJECTIVE_KEYS = {
+    field.name: json_key(Objectives, field) for field in dataclasses.fields(Objectives)
+}
+_OBJECTIVE_NAMES = {name: name for name in _OBJECTIVE_KEYS}
+_TEAM_ID = json_key(
+    Team, next(f for f in dataclasses.fields(Team) if f.name == "team_id")
+)
+
+Column = Union[str, np.ndarray]
+
+
+def _number(value: Any) -> float:
+    return np.nan if value is None else value
+
+
+def _row(
+    match_id: str,
+    info: Any,
+    participants: Sequence[Any],
+    objectives: Tuple,
+    index: int,
+    get: Callable[[Any, str], Any],
+    info_keys: Dict[str, str],
+    keys: Dict[str, str],
+) -> Tuple:
+    """A row of the summoner, the participant at `index`, out of a match"""
+    participant = participants[index]
+    team_id = get(participant, keys["team_id"])
+    team = [p for p in participants if get(p, keys["team_id"]) == team_id]
+
+    return (
+        (match_id,)
+        + tuple(_number(get(info, info_keys[name])) for name in MATCH_NUMBERS)
+        + tuple(_number(get(participant, keys[name])) for name in PARTICIPANT_NUMBERS)
+        + tuple(bool(get(participant, keys[name])) for name in PARTICIPANT_FLAGS)
+        + tuple(get(participant, keys[name]) or "" for name in PARTICIPANT_LABELS)
+        + objectives
+        + tuple(
+            float(np.nansum([_number(get(p, keys[field])) for p in team]))
+            for field in TEAM_TOTALS.values()
+        )
+    )
+
+
+def _team_objectives(
+    teams: Sequence[Any],
+    team_id: int,
+    get: Callable[[Any, str], Any],
+    team_id_key: str,
+    objective_keys: Dict[str, str],
+) -> Tuple:
+    """Champion kills of a team, as riot counts them in its objectives, and its TEAM_FIRSTS"""
+    objectives = next(
+        (
+            get(team, "objectives")
+            for team in teams
+            if get(team, team_id_key) == team_id
+        ),
+        None,
+    )
+
+    def objective(name: str) -> Any:
+        return objectives and get(objectives, objective_keys[name])
+
+    champion = objective("champion")
+    firsts = map(objective, TEAM_FIRSTS.values())
+    return (_number(champion and get(champion, "kills")),) + tuple(
+        bool(first and get(first, "first")) for first in firsts
+    )
+
+
+def _match_rows(
+    match: Union[Match, LazyMatch], puuid: Optional[str] = None
+) -> List[Tuple]:
+    """Rows of a match, of the summoner with a PUUID, or of every participant if None"""
+    if isinstance(match, LazyMatch):
+        # Raw payloads, nothing of the match gets decoded
+        info = match.payload.get("info", {})
+        participants = info.get("participants", [])
+        get, info_keys, keys = dict.get, _INFO_KEYS, _PARTICIPANT_KEYS
+        teams, team_id_key = info.get("teams", []), _TEAM_ID
+        objective_keys = _OBJECTIVE_KEYS
+    else:
+        info = match.info
+        participants = info.participants
+        get, info_keys, keys = getattr, _INFO_NAMES, _PARTICIPANT_NAMES
+        teams, team_id_key = info.teams, "team_id"
+        objective_keys = _OBJECTIVE_NAMES
+
+    indexes = [
+        index
+        for index, participant in enumerate(participants)
+        if puuid is None or get(participant, keys["puuid"]) == puuid
+    ]
+    rows = []
+    for index in indexes:
+        team_id = get(participants[index], keys["team_id"])
+        rows.append(
+            _row(
+                match.metadata.match_id,
+                info,
+                participants,
+                _team_objectives(teams, team_id, get, team_id_key, objective_keys),
+                index,
+                get,
+                info_keys,
+                keys,
+            )
+        )
+    return rows
+
+
+class MatchStats:
+    """Games of a summoner as a NumPy record array, one row per game.
+
+    Rows hold every numeric, boolean and text field of the summoner's `Participant`, a few
+    fields of the match (`game_creation`, `queue_id`, ...), totals of their team
+    (`team_kills`, `team_damage`, ...) and the objectives it took first (`first_dragon`, ...),
+    in the order the matches were given. Numbers riot did not send are NaN, and every
+    aggregate skips them.
+    """
+
+    def __init__(self, records: np.recarray) -> None:
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.records[column]
+
+    # -------------------------------------------PRIVATE-----------------------------------------------
+
+    def _values(self, column: Column) -> np.ndarray:
+        return self.records[column] if isinstance(column, str) else column
+
+    # -------------------------------------------PUBLIC---------------------------------------------------
+
+    @classmethod
+    def from_matches(
+        cls, matches: Sequence[Union[Match, LazyMatch]], puuid: str
+    ) -> "MatchStats":
+        """Build the rows of a summoner out of matches, skipping those they did not play
+
+        Args:
+        -----
+            matches (Sequence[Union[Match, LazyMatch]]): Matches, decoded or lazy ones
+            puuid (str): A PUUID of the summoner
+
+        Returns:
+        --------
+            MatchStats: A row per match the summoner played, in the order of the matches
+        """
+        rows: List[Tuple] = []
+        for match in matches:
+            rows += _match_rows(match, puuid)
+        return cls(np.array(rows, dtype=DTYPE).view(np.recarray))
+
+    @classmethod
+    def of_participants(cls, match: Union[Match, LazyMatch]) -> "MatchStats":
+        """A row for every participant of a single match, in the order of participants"""
+        return cls(np.array(_match_rows(match), dtype=DTYPE).view(np.recarray))
+
+    @property
+    def chronological(self) -> "MatchStats":
+        """The rows from the oldest game, as riot lists matches newest first"""
+        order = np.argsort(self.records["game_creation"], kind="stable")
+        return MatchStats(self.records[order])
+
+    @property
+    def game_minutes(self) -> np.ndarray:
+        return self.records["game_duration"] / 60
+
+    @property
+    def kda(self) -> np.ndarray:
+        """(kills + assists) / deaths, deathless games divided by 1"""
+        return (self.records["kills"] + self.records["assists"]) / np.maximum(
+            self.records["deaths"], 1
+        )
+
+    @property
+    def kill_participation(self) -> np.ndarray:
+        """Percent of the team's kills the summoner took part in, NaN if the team had none"""
+        team_kills = self.records["team_kills"]
+        return np.divide(
+            (self.records["kills"] + self.records["assists"]) * 100,
+            team_kills,
+            out=np.full(len(self), np.nan),
+            where=team_kills > 0,
+        )
+
+    def per_minute(self, column: Column) -> np.ndarray:
+        minutes = self.game_minutes
+        return np.divide(
+            self._values(column),
+            minutes,
+            out=np.full(len(self), np.nan),
+            where=minutes > 0,
+        )
+
+    def mean(self, column: Column) -> float:
+        values = self._values(column)
+        return float(np.nanmean(values)) if np.any(~np.isnan(values)) else np.nan
+
+    def percentile(self, column: Column, q: Union[float, Sequence[float]]):
+        """Percentiles (0-100) of a column, e.g. `percentile("kills", [25, 50, 75])`"""
+        return np.nanpercentile(self._values(column), q)
+
+    def rolling(self, column: Column, window: int) -> np.ndarray:
+        """Mean of each `window` consecutive rows, one value per full window
+
+        Args:
+        -----
+            column (Column): A name of a column, or values of the same length as the rows
+            window (int): Rows in a window, at least 1
+
+        Raises:
+        -------
+            ValueError: On a window shorter than a single row
+
+        Returns:
+        --------
+            np.ndarray: len(rows) - window + 1 means, NaN for windows of NaNs only
+        """
+        if window < 1:
+            raise ValueError(f"A window has to hold at least 1 row, not {window}")
+
+        values = np.asarray(self._values(column), dtype=float)
+        present = ~np.isnan(values)
+        sums = np.cumsum(np.where(present, values, 0.0))
+        counts = np.cumsum(present)
+        sums = np.concatenate(([0.0], sums))
+        counts = np.concatenate(([0], counts))
+        window_sums = sums[window:] - sums[:-window]
+        window_counts = counts[window:] - counts[:-window]
+        return np.divide(
+            window_sums,
+            window_counts,
+            out=np.full(len(window_sums), np.nan),
+            where=window_counts > 0,
+        )
+
+    def group_by(
+        self, key: str, column: Column, aggregate: str = "mean"
+    ) -> Dict[Any, float]:
+        """Aggregate a column over groups of rows sharing a key, e.g. a champion
+
+        Args:
+        -----
+            key (str): A name of the column to group by, e.g. champion_name
+            column (Column): A name of a column, or values of the same length as the rows
+            aggregate (str): One of "mean", "sum" or "count". Defaults to "mean".
+
+        Returns:
+        --------
+            Dict[Any, float]: The aggregate of every group, by its key
+        """
+        if aggregate not in ("mean", "sum", "count"):
+            raise ValueError(f"Unknown aggregate: {aggregate}")
+
+        groups, inverse = np.unique(self.records[key], return_inverse=True)
+        values = np.asarray(self._values(column), dtype=float)
+        present = ~np.isnan(values)
+        sums = np.bincount(
+            inverse, weights=np.where(present, values, 0.0), minlength=len(groups)
+        )
+        counts = np.bincount(inverse, weights=present, minlength=len(groups))
+
+        if aggregate == "sum":
+            result = sums
+        elif aggregate == "count":
+            result = counts
+        else:
+            result = np.divide(
+                sums, counts, out=np.full(len(groups), np.nan), where=counts > 0
+            )
+        return dict(zip(groups.tolist(), result.tolist()))
+
+    def by_champion(self, column: Column, aggregate: str = "mean") -> Dict[str, float]:
+        return self.group_by("champion_name", column, aggregate)
+
+    def by_role(self, column: Column, aggregate: str = "mean") -> Dict[str, float]:
+        """Grouped by `team_position` (TOP, JUNGLE, MIDDLE, BOTTOM, UTILITY)"""
+        return self.group_by("team_position", column, aggregate)
+
+    def win_rate(self) -> float:
+        """Percent of the games won"""
+        return float(np.mean(self.records["win"]) * 100) if len(self) else np.nan
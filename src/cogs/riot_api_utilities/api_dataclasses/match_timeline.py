@@ -1,10 +1,15 @@
-from typing import List, Optional
+from functools import cached_property
+from typing import List, Optional, TYPE_CHECKING
 
 from dataclasses import dataclass, field
 from dataclasses_json import dataclass_json, LetterCase, config
 
 from .match import Metadata
 
+if TYPE_CHECKING:
+    from .timeline_columns import TimelineColumns
+    from .timeline_events import TimelineEvents
+
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
@@ -36,11 +41,15 @@ class Event:
     item_id: Optional[int] = None
     participant_id: Optional[int] = None
     level_up_type: Optional[str] = None
-    skills_slots: Optional[int] = None
+    skills_slots: Optional[int] = field(
+        default=None, metadata=config(field_name="skillSlot")
+    )
     ward_type: Optional[str] = None
     creator_id: Optional[int] = None
     level: Optional[int] = None
-    assisting_participants_ids: Optional[List[int]] = None
+    assisting_participants_ids: Optional[List[int]] = field(
+        default=None, metadata=config(field_name="assistingParticipantIds")
+    )
     bounty: Optional[str] = None
     kill_streak_length: Optional[int] = None
     killer_id: Optional[int] = None
@@ -48,6 +57,15 @@ class Event:
     victim_damage_dealt: Optional[List[DamageStatistics]] = None
     victim_damage_received: Optional[List[DamageStatistics]] = None
     victim_id: Optional[str] = None
+    team_id: Optional[int] = None
+    killer_team_id: Optional[int] = None
+    monster_type: Optional[str] = None
+    monster_sub_type: Optional[str] = None
+    building_type: Optional[str] = None
+    tower_type: Optional[str] = None
+    lane_type: Optional[str] = None
+    kill_type: Optional[str] = None
+    multi_kill_length: Optional[int] = None
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
@@ -111,6 +129,7 @@ class ParticipantFrame:
     position: Position
     time_enemy_spent_controlled: int
     xp: int
+    total_gold: Optional[int] = None
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
@@ -157,3 +176,17 @@ class TimelineInfo:
 class MatchTimeline:
     metadata: Metadata
     info: TimelineInfo
+
+    @cached_property
+    def columns(self) -> "TimelineColumns":
+        """Participant frames as (frames x participants) arrays, built on first access"""
+        from .timeline_columns import TimelineColumns
+
+        return TimelineColumns.from_timeline(self)
+
+    @cached_property
+    def events(self) -> "TimelineEvents":
+        """Events of all the frames as an indexed table, built on first access"""
+        from .timeline_events import TimelineEvents
+
+        return TimelineEvents.from_timeline(self)
@@ -12,3 +12,8 @@ class Summoner:
     profile_icon_id: str
     revision_date: int
     summoner_level: int
+
+
+def normalise_summoner_name(name: str) -> str:
+    """Riot ignores case and spaces in summoner names, so `Red Guy` and `redguy` are the same"""
+    return name.replace(" ", "").lower()
@@ -0,0 +1,176 @@
+import dataclasses
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+from .decoders import json_key
+from .match_timeline import (
+    DamageStats,
+    MatchTimeline,
+    ParticipantFrame,
+    ParticipantFrames,
+)
+
+PARTICIPANTS = 10
+# Participants 1-5 play for the blue team (100), 6-10 for the red one (200)
+BLUE_TEAM = slice(0, 5)
+RED_TEAM = slice(5, 10)
+
+FRAME_STATS: Tuple[str, ...] = (
+    "total_gold",
+    "current_gold",
+    "gold_per_second",
+    "xp",
+    "level",
+    "minions_killed",
+    "jungle_minions_killed",
+    "time_enemy_spent_controlled",
+)
+DAMAGE_STATS: Tuple[str, ...] = tuple(
+    field.name for field in dataclasses.fields(DamageStats)
+)
+
+_FRAME_KEYS = {
+    field.name: json_key(ParticipantFrame, field)
+    for field in dataclasses.fields(ParticipantFrame)
+}
+_DAMAGE_KEYS = {
+    field.name: json_key(DamageStats, field)
+    for field in dataclasses.fields(DamageStats)
+}
+# Attributes of ParticipantFrames, holding participants 1 to 10
+_PARTICIPANT_FRAMES = tuple(
+    field.name for field in dataclasses.fields(ParticipantFrames)
+)
+
+
+@dataclass
+class TimelineColumns:
+    """Participant frames of a timeline, as arrays shaped (frames x participants).
+
+    Column `p` holds the participant with id `p + 1`. Stats riot did not send are NaN.
+    """
+
+    timestamps: np.ndarray
+    stats: Dict[str, np.ndarray]
+    damage: Dict[str, np.ndarray]
+    position: np.ndarray
+
+    @classmethod
+    def empty(cls, frames: int) -> "TimelineColumns":
+        def column() -> np.ndarray:
+            return np.full((frames, PARTICIPANTS), np.nan)
+
+        return cls(
+            timestamps=np.zeros(frames),
+            stats={name: column() for name in FRAME_STATS},
+            damage={name: column() for name in DAMAGE_STATS},
+            position=np.full((frames, PARTICIPANTS, 2), np.nan),
+        )
+
+    # -------------------------------------------PRIVATE-----------------------------------------------
+
+    def _fill(
+        self,
+        frame: int,
+        participant_frame: Any,
+        get: Callable[[Any, str], Any],
+        frame_keys: Dict[str, str],
+        damage_keys: Dict[str, str],
+    ) -> None:
+        participant = get(participant_frame, frame_keys["participant_id"]) - 1
+        for name in FRAME_STATS:
+            value = get(participant_frame, frame_keys[name])
+            if value is not None:
+                self.stats[name][frame, participant] = value
+
+        damage_stats = get(participant_frame, frame_keys["damage_stats"])
+        if damage_stats is not None:
+            for name in DAMAGE_STATS:
+                value = get(damage_stats, damage_keys[name])
+                if value is not None:
+                    self.damage[name][frame, participant] = value
+
+        position = get(participant_frame, frame_keys["position"])
+        if position is not None:
+            self.position[frame, participant] = (get(position, "x"), get(position, "y"))
+
+    # -------------------------------------------PUBLIC---------------------------------------------------
+
+    @classmethod
+    def from_timeline(cls, timeline: MatchTimeline) -> "TimelineColumns":
+        """Build the columns out of a decoded timeline"""
+        frames = timeline.info.frames
+        columns = cls.empty(len(frames))
+        names = {name: name for name in _FRAME_KEYS}
+        damage_names = {name: name for name in _DAMAGE_KEYS}
+
+        for index, frame in enumerate(frames):
+            columns.timestamps[index] = frame.timestamp
+            for attribute in _PARTICIPANT_FRAMES:
+                participant_frame = getattr(frame.participant_frames, attribute, None)
+                if participant_frame is not None:
+                    columns._fill(
+                        index, participant_frame, getattr, names, damage_names
+                    )
+        return columns
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "TimelineColumns":
+        """Build the columns straight out of a raw timeline payload, without decoding it"""
+        frames = payload["info"]["frames"]
+        columns = cls.empty(len(frames))
+
+        for index, frame in enumerate(frames):
+            columns.timestamps[index] = frame["timestamp"]
+            for participant_frame in frame["participantFrames"].values():
+                columns._fill(
+                    index, participant_frame, dict.get, _FRAME_KEYS, _DAMAGE_KEYS
+                )
+        return columns
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """Frame and damage stats are reachable as attributes, e.g. `columns.total_gold`"""
+        for table in ("stats", "damage"):
+            columns = self.__dict__.get(table, {})
+            if name in columns:
+                return columns[name]
+        raise AttributeError(name)
+
+    @property
+    def minutes(self) -> np.ndarray:
+        return self.timestamps / 60_000
+
+    @property
+    def cs(self) -> np.ndarray:
+        """Creep score: lane and jungle minions"""
+        return self.stats["minions_killed"] + self.stats["jungle_minions_killed"]
+
+    def team_difference(self, stat: np.ndarray) -> np.ndarray:
+        """Blue team's total of a (frames x participants) stat minus red team's, per frame"""
+        return np.nansum(stat[:, BLUE_TEAM], axis=1) - np.nansum(
+            stat[:, RED_TEAM], axis=1
+        )
+
+    def gold_difference(self) -> np.ndarray:
+        return self.team_difference(self.stats["total_gold"])
+
+    def xp_difference(self) -> np.ndarray:
+        return self.team_difference(self.stats["xp"])
+
+    def per_minute(self, stat: np.ndarray) -> np.ndarray:
+        """A cumulative stat divided by the game time of each frame, 0 on the first frame"""
+        minutes = self.minutes[:, None]
+        return np.divide(
+            stat, minutes, out=np.zeros_like(stat, dtype=float), where=minutes > 0
+        )
+
+    def cs_per_minute(self) -> np.ndarray:
+        return self.per_minute(self.cs)
+
+    def versus(
+        self, stat: np.ndarray, participant_id: int, opponent_id: int
+    ) -> np.ndarray:
+        """Difference of a stat between two participants, e.g. lane opponents, per frame"""
+        return stat[:, participant_id - 1] - stat[:, opponent_id - 1]
@@ -0,0 +1,232 @@
+import dataclasses
+import sqlite3
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .decoders import json_key
+from .match_timeline import Event, MatchTimeline
+
+# Columns of the table, named after the fields of Event they are taken from
+_COLUMNS: Dict[str, str] = {
+    "type": "event_type",
+    "timestamp": "timestamp",
+    "participant_id": "participant_id",
+    "killer_id": "killer_id",
+    "victim_id": "victim_id",
+    "creator_id": "creator_id",
+    "team_id": "team_id",
+    "killer_team_id": "killer_team_id",
+    "item_id": "item_id",
+    "level": "level",
+    "skill_slot": "skills_slots",
+    "level_up_type": "level_up_type",
+    "ward_type": "ward_type",
+    "monster_type": "monster_type",
+    "monster_sub_type": "monster_sub_type",
+    "building_type": "building_type",
+    "tower_type": "tower_type",
+    "lane_type": "lane_type",
+    "kill_type": "kill_type",
+    "bounty": "bounty",
+    "kill_streak_length": "kill_streak_length",
+    "multi_kill_length": "multi_kill_length",
+}
+_EVENT_KEYS = {
+    field.name: json_key(Event, field) for field in dataclasses.fields(Event)
+}
+
+_SCHEMA = f"""
+CREATE TABLE events (
+    id INTEGER PRIMARY KEY,
+    frame INTEGER NOT NULL,
+    {", ".join(_COLUMNS)},
+    x INTEGER,
+    y INTEGER
+);
+CREATE TABLE assists (
+    event_id INTEGER NOT NULL REFERENCES events (id),
+    participant_id INTEGER NOT NULL
+);
+CREATE INDEX events_by_type ON events (type, timestamp);
+CREATE INDEX events_by_killer ON events (killer_id, type);
+CREATE INDEX events_by_victim ON events (victim_id, type);
+CREATE INDEX events_by_timestamp ON events (timestamp);
+CREATE INDEX assists_by_participant ON assists (participant_id, event_id);
+"""
+
+
+class TimelineEvents:
+    """Events of a timeline in an in-memory SQLite table, indexed by type, killer, victim and time.
+
+    Rows are `sqlite3.Row`s, so columns are accessible both by name and position.
+    """
+
+    def __init__(self) -> None:
+        self._connection = sqlite3.connect(":memory:", check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(_SCHEMA)
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    # -------------------------------------------PRIVATE-----------------------------------------------
+
+    def _load(
+        self,
+        frames: Sequence[Tuple[int, Sequence[Any]]],
+        get: Callable[[Any, str], Any],
+        keys: Dict[str, str],
+    ) -> None:
+        """Insert events of all the frames
+
+        Args:
+        -----
+            frames: Index of every frame along with its events
+            get: Getter of a value out of an event, getattr or dict.get
+            keys: Names the fields of Event are found under within an event
+        """
+        events, assists = [], []
+        for frame, frame_events in frames:
+            for event in frame_events:
+                event_id = len(events) + 1
+                position = get(event, keys["position"])
+                x, y = (
+                    (get(position, "x"), get(position, "y"))
+                    if position
+                    else (None, None)
+                )
+                events.append(
+                    (event_id, frame)
+                    + tuple(get(event, keys[field]) for field in _COLUMNS.values())
+                    + (x, y)
+                )
+                for participant_id in (
+                    get(event, keys["assisting_participants_ids"]) or []
+                ):
+                    assists.append((event_id, participant_id))
+
+        placeholders = ", ".join("?" for _ in range(len(_COLUMNS) + 4))
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT INTO events VALUES ({placeholders})", events
+            )
+            self._connection.executemany("INSERT INTO assists VALUES (?, ?)", assists)
+
+    # -------------------------------------------PUBLIC---------------------------------------------------
+
+    @classmethod
+    def from_timeline(cls, timeline: MatchTimeline) -> "TimelineEvents":
+        """Build the table out of a decoded timeline"""
+        table = cls()
+        table._load(
+            [(index, frame.events) for index, frame in enumerate(timeline.info.frames)],
+            getattr,
+            {name: name for name in _EVENT_KEYS},
+        )
+        return table
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "TimelineEvents":
+        """Build the table straight out of a raw timeline payload, without decoding it"""
+        table = cls()
+        table._load(
+            [
+                (index, frame.get("events", []))
+                for index, frame in enumerate(payload["info"]["frames"])
+            ],
+            dict.get,
+            _EVENT_KEYS,
+        )
+        return table
+
+    def query(self, sql: str, parameters: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """Run any query against the `events` and `assists` tables"""
+        return self._connection.execute(sql, parameters).fetchall()
+
+    def by_type(
+        self, event_type: str, start: int = 0, end: Optional[int] = None
+    ) -> List[sqlite3.Row]:
+        """Events of a type, e.g. WARD_PLACED, optionally within a time range (ms)"""
+        return self.query(
+            "SELECT * FROM events WHERE type = ? AND timestamp >= ? AND timestamp <= ? ORDER BY timestamp",
+            (event_type, start, end if end is not None else 2**62),
+        )
+
+    def kills(
+        self,
+        killer: Optional[int] = None,
+        victim: Optional[int] = None,
+        assist: Optional[int] = None,
+    ) -> List[sqlite3.Row]:
+        """CHAMPION_KILL events, filtered by killer, victim and an assisting participant
+
+        Args:
+        -----
+            killer (Optional[int]): Participant id of the killer
+            victim (Optional[int]): Participant id of the victim
+            assist (Optional[int]): Participant id of one of the assisting participants
+
+        Returns:
+        --------
+            List[sqlite3.Row]: Kills, in order of time
+        """
+        conditions, parameters = ["type = 'CHAMPION_KILL'"], []
+        if killer is not None:
+            conditions.append("killer_id = ?")
+            parameters.append(killer)
+        if victim is not None:
+            conditions.append("victim_id = ?")
+            parameters.append(victim)
+        if assist is not None:
+            conditions.append(
+                "id IN (SELECT event_id FROM assists WHERE participant_id = ?)"
+            )
+            parameters.append(assist)
+
+        return self.query(
+            f"SELECT * FROM events WHERE {' AND '.join(conditions)} ORDER BY timestamp",
+            parameters,
+        )
+
+    def deaths(self, participant_id: int) -> List[sqlite3.Row]:
+        return self.kills(victim=participant_id)
+
+    def death_positions(self, participant_id: int) -> List[Tuple[int, int, int]]:
+        """(timestamp, x, y) of every death of a participant"""
+        return [
+            (row["timestamp"], row["x"], row["y"])
+            for row in self.deaths(participant_id)
+        ]
+
+    def objectives(self, team_id: Optional[int] = None) -> List[sqlite3.Row]:
+        """Epic monsters and buildings taken, by a team (killer_team_id) if given"""
+        sql = (
+            "SELECT * FROM events WHERE type IN ('ELITE_MONSTER_KILL', 'BUILDING_KILL')"
+        )
+        parameters: List[Any] = []
+        if team_id is not None:
+            # Buildings carry the team which lost them, monsters the team which took them
+            sql += (
+                " AND ((type = 'ELITE_MONSTER_KILL' AND killer_team_id = ?)"
+                " OR (type = 'BUILDING_KILL' AND team_id != ?))"
+            )
+            parameters += [team_id, team_id]
+        return self.query(sql + " ORDER BY timestamp", parameters)
+
+    def first(self, event_type: str, **columns: Any) -> Optional[sqlite3.Row]:
+        """The earliest event of a type, matching all the given columns, e.g. monster_type='DRAGON'"""
+        unknown = set(columns) - set(_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown event columns: {', '.join(sorted(unknown))}")
+
+        conditions = ["type = ?"] + [f"{column} = ?" for column in columns]
+        parameters = [event_type, *columns.values()]
+        rows = self.query(
+            f"SELECT * FROM events WHERE {' AND '.join(conditions)} ORDER BY timestamp LIMIT 1",
+            parameters,
+        )
+        return rows[0] if rows else None
+
+    def count(self, event_type: str) -> int:
+        return self.query("SELECT COUNT(*) FROM events WHERE type = ?", (event_type,))[
+            0
+        ][0]
@@ -1,15 +1,30 @@
 from abc import ABC, abstractmethod
 import io
+from dataclasses import replace
 from datetime import datetime
 from enum import Enum
+from typing import Hashable, List, Optional, Tuple, Union
 
 import discord
 from discord.embeds import Embed
-import matplotlib.pyplot as plt
-from PIL import Image
-
-from cogs.riot_api_utilities.riot_api import RiotApi
-from cogs.riot_api_utilities.api_dataclasses.champion import champions_data
+import numpy as np
+
+from cogs.riot_api_utilities.async_riot_api import AsyncRiotApi, RiotApiError
+from cogs.riot_api_utilities.api_dataclasses.data_dragon import data_dragon
+from cogs.riot_api_utilities.api_dataclasses.match_stats import MatchStats
+from cogs.riot_api_utilities.api_dataclasses.summoner import Summoner
+from cogs.riot_api_utilities.cache import TTLCache
+from cogs.riot_api_utilities.constants import TEAM
+from cogs.riot_api_utilities.match_query import QUEUE_NAMES, parse_query
+from cogs.riot_api_utilities.chart_renderer import (
+    Chart,
+    ChartGrid,
+    ChartRenderer,
+    RenderedChart,
+    Series,
+    chart_cache,
+    chart_renderer,
+)
 
 
 class UnknownTypeException(Exception):
@@ -23,63 +38,138 @@ class EmbedType(Enum):
     SUMMONER = "summoner"
     KILL_PARTICIPATION = "kp"
     SPECTATE = "spectate"
+    DASHBOARD = "dashboard"
+    SUMMARY = "summary"
+    LEADERBOARD = "leaderboard"
+    SEARCH = "search"
 
 
 class ApiEmbed(ABC):
+    # The chart of an embed, encoded as PNG once rendered, None for embeds without one
+    image: Optional[io.BytesIO] = None
+
     @abstractmethod
-    def create_embed(self) -> discord.Embed:
+    async def create_embed(self) -> discord.Embed:
         pass
 
-    def _figure_to_image(self, figure) -> Image:
-        """Protected function, converting matplotlib figure into pillow Image
-
-        Args:
-            figure (matplotlib.pyplot.figure): Matplotlib figure
+    def attachment(self) -> Optional[discord.File]:
+        """The chart of the embed, as a file to be sent along with it
 
         Returns:
-            Image: A figure converted into pillow Image
+            Optional[discord.File]: The chart, shown by the embed as attachment://image.png
         """
+        if self.image is None:
+            return None
+        self.image.seek(0)
+        return discord.File(self.image, filename="image.png")
 
-        data_stream = io.BytesIO()
-        figure.savefig(data_stream)
-        data_stream.seek(0)
-        image = Image.open(data_stream)
-        return image
+    async def _render_chart(
+        self, renderer: ChartRenderer, chart: Union[Chart, ChartGrid]
+    ) -> None:
+        """Protected function, rendering a chart off the event loop into `image`
+
+        Args:
+            renderer (ChartRenderer): A pool of processes rendering charts
+            chart (Union[Chart, ChartGrid]): A description of the chart, or of several
+        """
+        self.image = io.BytesIO(await renderer.render(chart))
 
     @staticmethod
     def _convert_unix_timestamp(timestamp: int) -> str:
         return datetime.utcfromtimestamp(timestamp / 1000).strftime("%H:%M %d-%m-%y")
 
+    @staticmethod
+    def _error_embed(title: str, summoner: str, error: RiotApiError) -> discord.Embed:
+        """A red embed telling why riot gave no answer, sent instead of the command failing
+
+        Args:
+            title (str): A title of the embed
+            summoner (str): A name of the summoner asked for
+            error (RiotApiError): The error riot answered with
+
+        Returns:
+            discord.Embed: "summoner not found" on a 404, a request to try later otherwise
+        """
+        if error.status == 404:
+            description = f"Nie znaleziono summonera: {summoner}"
+        else:
+            description = f"Riot nie odpowiada ({error.status}), sprobuj pozniej"
+        return discord.Embed(
+            title=title, description=description, color=discord.Color.red()
+        )
 
-class DamageEmbedApi(ApiEmbed):
-    def __init__(self, api: RiotApi, summoner: str):
+
+class ChartEmbedApi(ApiEmbed):
+    """An embed showing a chart of the last games of a summoner.
+
+    Rendered charts are cached under (PUUID, embed type, newest match ID, options), so
+    until the summoner plays another game, the chart is only checked for being up to date.
+    """
+
+    embed_type: EmbedType
+    # Render options the chart depends on, besides the matches
+    options: Tuple[Hashable, ...] = ()
+
+    def __init__(
+        self,
+        api: AsyncRiotApi,
+        summoner: Optional[str] = None,
+        renderer: ChartRenderer = chart_renderer,
+        cache: TTLCache[RenderedChart] = chart_cache,
+    ) -> None:
         self.api = api
         self.summoner = summoner
+        self.renderer = renderer
+        self.cache = cache
 
-    def create_embed(self) -> discord.Embed:
-        summoner = self.api.summoner_search(self.summoner)
-        matches, _ = self.api.get_summoner_games(self.summoner)
-        matches_dates = []
-        damage_stats = []
+    @abstractmethod
+    async def _create_chart_embed(self, summoner: Summoner) -> discord.Embed:
+        """Fetch the games, render the chart into `image` and build the embed"""
 
-        for match in matches:
-            for participant in match.info.participants:
+    async def _match_stats(self, summoner: Summoner) -> MatchStats:
+        """Stats of the last 10 games of the summoner, shared by all the charts"""
+        matches, _ = await self.api.get_summoner_games(self.summoner, timelines=False)
+        return MatchStats.from_matches(matches, summoner.puuid)
 
-                if summoner.puuid == participant.puuid:
-                    damage_stats.append(participant.total_damage_dealt_to_champions)
+    @classmethod
+    def _dates(cls, timestamps: np.ndarray) -> List[str]:
+        return [cls._convert_unix_timestamp(timestamp) for timestamp in timestamps]
+
+    async def create_embed(self) -> discord.Embed:
+        try:
+            summoner = await self.api.summoner_search(self.summoner)
+            newest_match_id = await self.api.newest_match_id(summoner.puuid)
+            key = (summoner.puuid, self.embed_type, newest_match_id, self.options)
+
+            cached = self.cache.get(key) if newest_match_id else None
+            if cached is not None:
+                self.image = io.BytesIO(cached.image)
+                return discord.Embed.from_dict(cached.embed)
+
+            embed = await self._create_chart_embed(summoner)
+        except RiotApiError as err:
+            self.image = None
+            return self._error_embed(self.embed_type.value.upper(), self.summoner, err)
+        if newest_match_id and self.image is not None:
+            self.cache.put(key, RenderedChart(self.image.getvalue(), embed.to_dict()))
+        return embed
 
-            matches_dates.append(
-                self._convert_unix_timestamp(match.info.game_start_timestamp)
-            )
 
-        figure = plt.figure()
+class DamageEmbedApi(ChartEmbedApi):
+    embed_type = EmbedType.DAMAGE
 
-        plt.bar(matches_dates[::-1], damage_stats[::-1], color="maroon", width=0.5)
-        # Rotate x labels by 30 degrees
-        figure.autofmt_xdate(ha="right")
+    @classmethod
+    def chart(cls, summoner: Summoner, stats: MatchStats) -> Chart:
+        games = stats.chronological
+        return Chart.bar(
+            cls._dates(games["game_start_timestamp"]),
+            games["total_damage_dealt_to_champions"],
+            color="maroon",
+        )
 
-        pil_image = self._figure_to_image(figure)
-        pil_image.save("test.png")
+    async def _create_chart_embed(self, summoner: Summoner) -> discord.Embed:
+        stats = await self._match_stats(summoner)
+        await self._render_chart(self.renderer, self.chart(summoner, stats))
         embed = discord.Embed(
             title="Damage",
             description=f"Damage zadany przez: {summoner.name}",
@@ -87,44 +177,26 @@ class DamageEmbedApi(ApiEmbed):
         )
         embed.set_image(url="attachment://image.png")
 
-        plt.clf()
-
         return embed
 
 
-class DefenseEmbedApi(ApiEmbed):
-    def __init__(self, api: RiotApi, summoner: str):
-        self.api = api
-        self.summoner = summoner
-
-    def create_embed(self) -> discord.Embed:
-        summoner = self.api.summoner_search(self.summoner)
-        matches, _ = self.api.get_summoner_games(self.summoner)
-        matches_dates = []
-        defensive_stats = []
-
-        for match in matches:
-            for participant in match.info.participants:
+class DefenseEmbedApi(ChartEmbedApi):
+    embed_type = EmbedType.DEFENSE
 
-                if summoner.puuid == participant.puuid:
-                    defensive_stats.append(
-                        participant.total_damage_taken
-                        + participant.damage_self_mitigated
-                    )
-
-            matches_dates.append(
-                self._convert_unix_timestamp(match.info.game_start_timestamp)
-            )
-
-        figure = plt.figure()
+    @classmethod
+    def chart(cls, summoner: Summoner, stats: MatchStats) -> Chart:
+        games = stats.chronological
+        return Chart.bar(
+            cls._dates(games["game_start_timestamp"]),
+            games["total_damage_taken"] + games["damage_self_mitigated"],
+            color="darkblue",
+            title=f"Damage przyjety przez: {summoner.name}",
+            ylabel="Damage przyjety",
+        )
 
-        plt.bar(matches_dates[::-1], defensive_stats[::-1], color="darkblue", width=0.5)
-        # Rotate x labels by 30 degrees
-        figure.autofmt_xdate(ha="right")
-        plt.ylabel("Damage przyjety")
-        plt.title(f"Damage przyjety przez: {summoner.name}")
-        pil_image = self._figure_to_image(figure)
-        pil_image.save("test.png")
+    async def _create_chart_embed(self, summoner: Summoner) -> discord.Embed:
+        stats = await self._match_stats(summoner)
+        await self._render_chart(self.renderer, self.chart(summoner, stats))
         embed = discord.Embed(
             title="Def",
             description=f"Damage przyjety przez: {summoner.name}",
@@ -132,50 +204,36 @@ class DefenseEmbedApi(ApiEmbed):
         )
         embed.set_image(url="attachment://image.png")
 
-        plt.clf()
-
         return embed
 
 
-class KdaEmbedApi(ApiEmbed):
-    def __init__(self, api: RiotApi, summoner: str) -> None:
-        self.api = api
-        self.summoner = summoner
+class KdaEmbedApi(ChartEmbedApi):
+    embed_type = EmbedType.KDA
 
-    def create_embed(self) -> discord.Embed:
-        summoner = self.api.summoner_search(self.summoner)
-        matches, _ = self.api.get_summoner_games(self.summoner)
-        kills, deaths, assists = [], [], []
-        matches_dates = []
-
-        for match in matches:
-            [
-                (
-                    kills.append(participant.kills),
-                    deaths.append(participant.deaths),
-                    assists.append(participant.assists),
-                )
-                for participant in match.info.participants
-                if participant.puuid == summoner.puuid
+    @classmethod
+    def chart(cls, summoner: Summoner, stats: MatchStats) -> Chart:
+        games = stats.chronological
+        series = []
+        if len(games):
+            series = [
+                Series(tuple(games["kills"]), "b--", label="Kills"),
+                Series(tuple(games["deaths"]), "r--", label="Deaths"),
+                Series(tuple(games["assists"]), "g:", label="Assists"),
             ]
 
-            matches_dates.append(self._convert_unix_timestamp(match.info.game_creation))
-
-        if kills and deaths and assists:
-            plt.plot(matches_dates[::-1], kills[::-1], "b--", label="Kills")
-            plt.plot(matches_dates[::-1], deaths[::-1], "r--", label="Deaths")
-            plt.plot(matches_dates[::-1], assists[::-1], "g:", label="Assists")
-            plt.legend()
-
-        figure = plt.gcf()
-        # Rotate x labels by 30 degrees
-        figure.autofmt_xdate(ha="right")
-
-        plt.title(
-            f"KDA: Srednie = {round(sum(kills)/len(kills), 1)}/{round(sum(deaths)/len(deaths), 1)}/{round(sum(assists)/len(assists), 1)}"
+        averages = "/".join(
+            str(round(stats.mean(column), 1))
+            for column in ("kills", "deaths", "assists")
+        )
+        return Chart.line(
+            cls._dates(games["game_creation"]),
+            series,
+            title=f"KDA: Srednie = {averages}",
         )
-        pil_image = self._figure_to_image(figure)
-        pil_image.save("test.png")
+
+    async def _create_chart_embed(self, summoner: Summoner) -> discord.Embed:
+        stats = await self._match_stats(summoner)
+        await self._render_chart(self.renderer, self.chart(summoner, stats))
         embed = discord.Embed(
             title="KDA",
             description=f"KDA dla {summoner.name}",
@@ -183,22 +241,20 @@ class KdaEmbedApi(ApiEmbed):
         )
         embed.set_image(url="attachment://image.png")
 
-        plt.clf()
-
         return embed
 
 
 class SummonerEmbedApi(ApiEmbed):
-    def __init__(self, api: RiotApi, summoner: str):
+    def __init__(self, api: AsyncRiotApi, summoner: str):
         self.api = api
         self.summoner = summoner
 
-    def create_embed(self) -> discord.Embed:
+    async def create_embed(self) -> discord.Embed:
         try:
-            summoner_data = self.api.summoner_search(self.summoner)
-        except Exception as err:
-            return "LOL"
-        match, _ = self.api.summoners_last_game(self.summoner)
+            summoner_data = await self.api.summoner_search(self.summoner)
+            match, _ = await self.api.summoners_last_game(self.summoner)
+        except RiotApiError as err:
+            return self._error_embed("__SUMMONER SEARCH__", self.summoner, err)
         match_timestamp = self._convert_unix_timestamp(match.info.game_creation)
         game_mode = match.info.game_mode
         damage_chart = []
@@ -277,11 +333,11 @@ Informacje ofensywne```
 
 
 class SpectateEmbedApi(ApiEmbed):
-    def __init__(self, api: RiotApi, summoner: str):
+    def __init__(self, api: AsyncRiotApi, summoner: str):
         self.api = api
         self.summoner = summoner
 
-    def create_embed(self) -> discord.Embed:
+    async def create_embed(self) -> discord.Embed:
         """Generate a discord.Embed from spectate data.
         Ritos api is so freeaking baaaad, it literally doesnt give any useful information
 
@@ -293,7 +349,11 @@ class SpectateEmbedApi(ApiEmbed):
         -------
             discord.Embed: An embedded message generated from data, or a simple embed showcasing the player is not currently in-game
         """
-        game_data = self.api.summoners_current_game(self.summoner)
+        try:
+            game_data = await self.api.summoners_current_game(self.summoner)
+        except RiotApiError:
+            # The tracker loop skips the member, and asks again in a minute
+            return None
         if not game_data:
             return False
 
@@ -304,53 +364,34 @@ class SpectateEmbedApi(ApiEmbed):
             if participant.summoner_name.lower() == self.summoner.lower()
         ][0]
 
-        champ_data = [value for value in champions_data.data.values() if int(value.key) == summoner_data.champion_id][0]
+        # Live games are played on the newest patch, which may have champions the bundled data lacks
+        champions = await data_dragon.latest_champions()
+        champ_data = champions.by_key(summoner_data.champion_id)
+        champion = champ_data.name if champ_data else summoner_data.champion_id
         title = "__Tracker__"
-        description = f"```ini\n[Generalne Informacje]```\n\n**Nick:** {summoner_data.summoner_name}  \n\n**Mode:** {game_data.game_mode} \n\n**Gra:** {champ_data.name}"
+        description = f"```ini\n[Generalne Informacje]```\n\n**Nick:** {summoner_data.summoner_name}  \n\n**Mode:** {game_data.game_mode} \n\n**Gra:** {champion}"
     
 
         embed = discord.Embed(title=title, description=description, color=discord.Color.dark_blue())
         return embed
 
 
-class KillParticipationEmbedApi(ApiEmbed):
-    def __init__(self, api: RiotApi, summoner: str):
-        self.api = api
-        self.summoner = summoner
+class KillParticipationEmbedApi(ChartEmbedApi):
+    embed_type = EmbedType.KILL_PARTICIPATION
+
+    @classmethod
+    def chart(cls, summoner: Summoner, stats: MatchStats) -> Chart:
+        games = stats.chronological
+        return Chart.bar(
+            cls._dates(games["game_creation"]),
+            np.round(games.kill_participation, 1),
+            color="darkslategray",
+            ylabel="% Kill Participation",
+        )
 
-    def create_embed(self) -> discord.Embed:
-        summoner = self.api.summoner_search(self.summoner)
-        matches, _ = self.api.get_summoner_games(self.summoner)
-        matches_dates = []
-        kp = []
-
-        team_id = None
-        team_kills = None
-        summoner_ka = None
-
-        for match in matches:
-            for participant in match.info.participants:
-                if participant.puuid == summoner.puuid:
-                    team_id = participant.team_id
-                    summoner_ka = participant.kills + participant.assists
-
-            team_kills = [
-                team.objectives.champion.kills
-                for team in match.info.teams
-                if team.team_id == team_id
-            ][0]
-            kp.append(round(summoner_ka / team_kills * 100, 1))
-            matches_dates.append(self._convert_unix_timestamp(match.info.game_creation))
-
-        figure = plt.figure()
-
-        plt.bar(matches_dates[::-1], kp[::-1], color="darkslategray", width=0.5)
-        # Rotate x labels by 30 degrees
-        figure.autofmt_xdate(ha="right")
-        plt.ylabel("% Kill Participation")
-
-        pil_image = self._figure_to_image(figure)
-        pil_image.save("test.png")
+    async def _create_chart_embed(self, summoner: Summoner) -> discord.Embed:
+        stats = await self._match_stats(summoner)
+        await self._render_chart(self.renderer, self.chart(summoner, stats))
         embed = discord.Embed(
             title="Kill Participation",
             description=f"Kill participation %: {summoner.name}",
@@ -358,25 +399,253 @@ class KillParticipationEmbedApi(ApiEmbed):
         )
         embed.set_image(url="attachment://image.png")
 
-        plt.clf()
+        return embed
+
+
+class DashboardEmbedApi(ChartEmbedApi):
+    """KDA, damage, damage taken and kill participation, as one figure of four charts.
+
+    The games are fetched once and every chart is drawn from the same matches, so the whole
+    overview costs as much as any single one of the charts.
+    """
+
+    embed_type = EmbedType.DASHBOARD
+    # Charts of the dashboard, with titles for those which have none of their own
+    CHARTS = (
+        (KdaEmbedApi, None),
+        (DamageEmbedApi, "Damage"),
+        (DefenseEmbedApi, "Damage przyjety"),
+        (KillParticipationEmbedApi, "Kill Participation"),
+    )
+    # Games averaged by every point of the KDA trend
+    TREND_WINDOW = 3
+
+    @classmethod
+    def fields(cls, stats: MatchStats) -> List[Tuple[str, str]]:
+        """Fields of the embed, summing up the same games the charts are drawn from
+
+        Args:
+            stats (MatchStats): Stats of the games
+
+        Returns:
+            List[Tuple[str, str]]: Names and values of the fields, none if there are no games
+        """
+        if not len(stats):
+            return []
+
+        games = stats.chronological
+        trend = games.rolling(games.kda, min(cls.TREND_WINDOW, len(games)))
+        damage = games.percentile("total_damage_dealt_to_champions", [25, 50, 75])
+        role_games = games.by_role("win", "count")
+        role_wins = games.by_role("win")
+        champions = sorted(
+            games.by_champion(games.kda).items(), key=lambda item: item[1], reverse=True
+        )
+        return [
+            ("Wygrane", f"{games.win_rate():.0f}%"),
+            ("Trend KDA", " -> ".join(f"{kda:.1f}" for kda in trend)),
+            ("Damage 25/50/75%", "/".join(f"{value:.0f}" for value in damage)),
+            (
+                "Role",
+                "\n".join(
+                    f"**{role or '-'}:** {role_games[role]:.0f} gier, {role_wins[role] * 100:.0f}% wygranych"
+                    for role in role_games
+                ),
+            ),
+            (
+                "KDA na postaciach",
+                "\n".join(f"**{champion}:** {kda:.2f}" for champion, kda in champions),
+            ),
+        ]
+
+    async def _create_chart_embed(self, summoner: Summoner) -> discord.Embed:
+        stats = await self._match_stats(summoner)
+        charts = []
+        for embed_api, title in self.CHARTS:
+            chart = embed_api.chart(summoner, stats)
+            charts.append(replace(chart, title=title) if title else chart)
+
+        await self._render_chart(self.renderer, ChartGrid(tuple(charts), columns=2))
+        embed = discord.Embed(
+            title="Dashboard",
+            description=f"Ostatnie {len(stats)} gier: {summoner.name}",
+            color=discord.Color.blue(),
+        )
+        for name, value in self.fields(stats):
+            embed.add_field(name=name, value=value, inline=False)
+        embed.set_image(url="attachment://image.png")
+
+        return embed
+
+
+class SummaryEmbedApi(ApiEmbed):
+    """Averages over every stored game of a summoner, read from the match store's aggregates"""
+
+    def __init__(self, api: AsyncRiotApi, summoner: str):
+        self.api = api
+        self.summoner = summoner
+
+    async def create_embed(self) -> discord.Embed:
+        try:
+            summoner, aggregates = await self.api.summoner_aggregates(self.summoner)
+        except RiotApiError as err:
+            return self._error_embed("Podsumowanie", self.summoner, err)
+        if aggregates is None:
+            return discord.Embed(
+                title="Podsumowanie",
+                description=f"Brak zapisanych gier: {summoner.name}",
+                color=discord.Color.blue(),
+            )
+
+        def average(stat: str, digits: int = 1) -> str:
+            running = aggregates.stat(stat)
+            if not running.count:
+                return "-"
+            if running.count < 2:
+                return f"{running.mean:.{digits}f}"
+            return f"{running.mean:.{digits}f} ± {running.std:.{digits}f}"
+
+        kills, deaths, assists = (
+            aggregates.stat(stat).mean for stat in ("kills", "deaths", "assists")
+        )
+        champions = "\n".join(
+            f"**{champion}:** {record.games} gier, {record.win_rate:.0f}% wygranych"
+            for champion, record in aggregates.top_champions()
+        )
+        embed_message = f"""
+                            **Gry:** {aggregates.games}
+                            **Wygrane:** {aggregates.wins} ({aggregates.win_rate:.1f}%)
+                            **Srednie KDA:** {kills:.1f}/{deaths:.1f}/{assists:.1f}
+                            **KDA:** {average("kda", 2)}
+                            **Kill Participation:** {average("kill_participation")}%
+                            **Dmg/min:** {average("damage_per_minute")}
+                            **Gold/min:** {average("gold_per_minute")}
+                            **CS/min:** {average("cs_per_minute")}
+                            **Wizja:** {average("vision_score")}
+                            """
+
+        embed = discord.Embed(
+            title="Podsumowanie",
+            description=embed_message,
+            color=discord.Color.blue(),
+        )
+        embed.add_field(name="Najczesciej grane", value=champions or "-", inline=False)
+        embed.set_footer(text=summoner.name)
+
+        return embed
+
+
+class LeaderboardEmbedApi(ApiEmbed):
+    """Tracked summoners ranked by their averages, answered by the match store's aggregates
+
+    Riot is asked only for the names it has never resolved, once for each of them.
+    """
+
+    # Ranked stats, with their names and formats
+    STATS = (
+        ("kda", "KDA", "{:.2f}"),
+        ("damage_per_minute", "Dmg/min", "{:.0f}"),
+        ("kill_participation", "Kill Participation", "{:.1f}%"),
+        ("vision_score", "Wizja", "{:.1f}"),
+    )
+
+    def __init__(self, api: AsyncRiotApi, summoners: List[str] = TEAM):
+        self.api = api
+        self.summoners = summoners
+
+    async def create_embed(self) -> discord.Embed:
+        for name in self.summoners:
+            if self.api.match_store.summoner_puuid(name) is None:
+                try:
+                    await self.api.summoner_search(name)
+                except RiotApiError:
+                    # Left out of the board, and listed in the footer
+                    continue
+
+        board = self.api.match_store.leaderboard(
+            self.summoners, [stat for stat, _, _ in self.STATS]
+        )
+        embed = discord.Embed(title="Leaderboard", color=discord.Color.blue())
+        for stat, name, value_format in self.STATS:
+            lines = [
+                f"**{place}. {entry.name}:** {value_format.format(entry.stat.mean)} ({entry.games} gier)"
+                for place, entry in enumerate(board[stat], start=1)
+            ]
+            embed.add_field(name=name, value="\n".join(lines) or "-", inline=False)
+
+        ranked = {entry.name for entries in board.values() for entry in entries}
+        missing = [name for name in self.summoners if name not in ranked]
+        if missing:
+            embed.set_footer(text=f"Brak zapisanych gier: {', '.join(missing)}")
+
+        return embed
+
+
+class SearchEmbedApi(ApiEmbed):
+    """Stored games of a summoner matching a query of the bot's syntax, see `parse_query`"""
+
+    def __init__(self, api: AsyncRiotApi, query: str):
+        self.api = api
+        self.query = query
+
+    async def create_embed(self) -> discord.Embed:
+        try:
+            summoner, query = parse_query(self.query.split())
+            games = await self.api.find_matches(summoner, query)
+        except ValueError as err:
+            return discord.Embed(
+                title="Wyszukiwanie",
+                description=f"Niepoprawne zapytanie: {err}",
+                color=discord.Color.red(),
+            )
+        except RiotApiError as err:
+            return self._error_embed("Wyszukiwanie", summoner, err)
+
+        lines = [
+            f"**{self._convert_unix_timestamp(game['game_start_timestamp'])}** "
+            f"{game['champion']} {game['kills']}/{game['deaths']}/{game['assists']} "
+            f"{'Wygrana' if game['win'] else 'Przegrana'} "
+            f"({QUEUE_NAMES.get(game['queue_id'], game['queue_id'])})"
+            for game in games
+        ]
+        embed = discord.Embed(
+            title="Wyszukiwanie",
+            description="\n".join(lines) or "Brak zapisanych gier",
+            color=discord.Color.blue(),
+        )
+        embed.set_footer(text=f"{summoner}: {len(games)} gier")
 
         return embed
 
 
 class EmbedFactory:
     @staticmethod
-    def factory_embed(embed_type: EmbedType, api: RiotApi, summoner: str) -> ApiEmbed:
+    def factory_embed(
+        embed_type: EmbedType,
+        api: AsyncRiotApi,
+        summoner: Optional[str] = None,
+        renderer: ChartRenderer = chart_renderer,
+        cache: TTLCache[RenderedChart] = chart_cache,
+    ) -> ApiEmbed:
         if embed_type == EmbedType.DAMAGE:
-            return DamageEmbedApi(api, summoner)
+            return DamageEmbedApi(api, summoner, renderer, cache)
         if embed_type == EmbedType.DEFENSE:
-            return DefenseEmbedApi(api, summoner)
+            return DefenseEmbedApi(api, summoner, renderer, cache)
         if embed_type == EmbedType.KDA:
-            return KdaEmbedApi(api, summoner)
+            return KdaEmbedApi(api, summoner, renderer, cache)
         if embed_type == EmbedType.SUMMONER:
             return SummonerEmbedApi(api, summoner)
         if embed_type == EmbedType.SPECTATE:
             return SpectateEmbedApi(api, summoner)
         if embed_type == EmbedType.KILL_PARTICIPATION:
-            return KillParticipationEmbedApi(api, summoner)
+            return KillParticipationEmbedApi(api, summoner, renderer, cache)
+        if embed_type == EmbedType.DASHBOARD:
+            return DashboardEmbedApi(api, summoner, renderer, cache)
+        if embed_type == EmbedType.SUMMARY:
+            return SummaryEmbedApi(api, summoner)
+        if embed_type == EmbedType.LEADERBOARD:
+            return LeaderboardEmbedApi(api)
+        if embed_type == EmbedType.SEARCH:
+            return SearchEmbedApi(api, summoner)
         
         raise UnknownTypeException(f"{type} doesn't exists within factory")
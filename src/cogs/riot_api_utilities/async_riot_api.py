@@ -0,0 +1,694 @@
+import asyncio
+import logging
+from collections import deque
+from dataclasses import replace
+from datetime import datetime
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import aiohttp
+
+from .api_dataclasses.decoders import decode_match_timeline
+from .api_dataclasses.lazy_match import LazyMatch
+from .api_dataclasses.match_timeline import MatchTimeline
+from .api_dataclasses.summoner import Summoner, normalise_summoner_name
+from .api_dataclasses.spectator import SpectatorData
+from .constants import (
+    MATCH_CACHE_SIZE,
+    MATCH_FETCH_WORKERS,
+    MATCH_IDS_MAX_COUNT,
+    MATCH_PREFETCH,
+    MATCH_STORE_PATH,
+    MATCH_SYNC_PAGE_SIZE,
+    PLATFORM_HOST,
+    REGION_HOST,
+    RIOT_HEADERS,
+    SUMMONER_CACHE_SIZE,
+    SUMMONER_CACHE_TTL,
+)
+from .aggregates import SummonerAggregates
+from .cache import TTLCache
+from .match_query import MatchQuery
+from .match_store import MatchStore
+from .rate_limiter import MAX_RETRIES, RateLimiter, riot_rate_limiter
+from .single_flight import SingleFlight
+from .timeline_stream import TimelineReader, event_types, filter_events
+
+logger = logging.getLogger(__name__)
+
+# Size of a keep-alive pool kept for each of the routing hosts
+CONNECTIONS_PER_HOST = 20
+KEEPALIVE_TIMEOUT = 60
+
+T = TypeVar("T")
+Reader = Callable[[aiohttp.ClientResponse], Awaitable[Any]]
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    return await response.json()
+
+
+class RiotApiError(Exception):
+    """Raised when riot answers with a status other than 200 where a payload is required"""
+
+    def __init__(self, status: int, path: str) -> None:
+        super().__init__(f"Riot answered {path} with {status}")
+        self.status = status
+        self.path = path
+
+
+class AsyncRiotApi:
+    """A client of riot's api, which does not block the event loop.
+
+    Every routing host gets its own session, hence its own keep-alive connection pool,
+    so concurrent commands reuse already established TLS connections.
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        rate_limiter: RateLimiter = riot_rate_limiter,
+        match_store: Optional[MatchStore] = None,
+    ):
+        self.api_token = api_token
+        self.headers = {**RIOT_HEADERS, "X-Riot-Token": f"{self.api_token}"}
+        self.rate_limiter = rate_limiter
+        self.match_store = match_store or MatchStore(MATCH_STORE_PATH)
+        self.summoner_cache: TTLCache[Summoner] = TTLCache(
+            SUMMONER_CACHE_SIZE, ttl=SUMMONER_CACHE_TTL
+        )
+        # Matches by ID, shared by every summoner who played them
+        self.match_cache: TTLCache[LazyMatch] = TTLCache(MATCH_CACHE_SIZE)
+        self.matches_in_flight: SingleFlight[LazyMatch] = SingleFlight()
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._fetch_slots: Optional[asyncio.Semaphore] = None
+        self._sync_locks: Dict[str, asyncio.Lock] = {}
+        # Identical requests sent at the same time share one response
+        self.in_flight: SingleFlight[Tuple[int, Any]] = SingleFlight()
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Counters of the caches and in-flight tables, showing how many calls they saved"""
+        return {
+            "summoner_cache": self.summoner_cache.stats,
+            "match_cache": self.match_cache.stats,
+            "in_flight": self.in_flight.stats,
+            "matches_in_flight": self.matches_in_flight.stats,
+        }
+
+    async def close(self) -> None:
+        """Close all the pooled sessions and the match store"""
+        logger.debug("Riot api stats: %s", self.stats)
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+        self.match_store.close()
+
+    # -------------------------------------------PRIVATE-----------------------------------------------
+
+    def _session(self, host: str) -> aiohttp.ClientSession:
+        """Get a pooled session for a routing host, creating it on first use
+
+        Args:
+        -----
+            host (str): A routing host, e.g. europe.api.riotgames.com
+
+        Returns:
+        --------
+            aiohttp.ClientSession: A session keeping connections to the host alive
+        """
+        session = self._sessions.get(host)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTIONS_PER_HOST, keepalive_timeout=KEEPALIVE_TIMEOUT
+            )
+            session = aiohttp.ClientSession(
+                base_url=f"https://{host}", headers=self.headers, connector=connector
+            )
+            self._sessions[host] = session
+        return session
+
+    async def _get(
+        self, host: str, method: str, path: str, read: Reader = _read_json
+    ) -> Tuple[int, Any]:
+        """Send a GET request to one of riot's hosts, unless the very same one is already in flight
+
+        Args:
+        -----
+            host (str): A routing host
+            method (str): A name of the endpoint, used for method rate limits
+            path (str): A path of an endpoint, with the query
+            read (Reader): Reads the body of a response. Defaults to decoding it as json.
+
+        Returns:
+        --------
+            Tuple[int, Any]: Status code of a response and its read body (None unless 200)
+        """
+        return await self.in_flight.do(
+            (host, path, read), lambda: self._send(host, method, path, read)
+        )
+
+    async def _send(
+        self, host: str, method: str, path: str, read: Reader = _read_json
+    ) -> Tuple[int, Any]:
+        """Send a GET request to one of riot's hosts, once the rate limiter lets it through
+
+        Requests answered with 429 are held back for `Retry-After` seconds and sent again.
+
+        Args:
+        -----
+            host (str): A routing host
+            method (str): A name of the endpoint, used for method rate limits
+            path (str): A path of an endpoint, with the query
+            read (Reader): Reads the body of a response. Defaults to decoding it as json.
+
+        Returns:
+        --------
+            Tuple[int, Any]: Status code of a response and its read body (None unless 200)
+        """
+        for _ in range(MAX_RETRIES + 1):
+            await self.rate_limiter.acquire(host, method)
+            async with self._session(host).get(path) as response:
+                self.rate_limiter.update(host, method, response.headers)
+                if response.status == 429:
+                    self.rate_limiter.backoff(host, method, response.headers)
+                    continue
+                # Bodies of errors, e.g. {"status": {...}} of a 503, are no payloads
+                if response.status != 200:
+                    return response.status, None
+                return response.status, await read(response)
+
+        response.raise_for_status()
+
+    async def _bounded(self, call: Callable[[str], Awaitable[T]], match_id: str) -> T:
+        """Call a fetch of a match once one of MATCH_FETCH_WORKERS fetch slots is free"""
+        if self._fetch_slots is None:
+            self._fetch_slots = asyncio.Semaphore(MATCH_FETCH_WORKERS)
+        async with self._fetch_slots:
+            return await call(match_id)
+
+    @staticmethod
+    async def _decode(
+        decoder: Callable[[Dict[str, Any]], Any], payload: Dict[str, Any]
+    ):
+        """Run a dataclass decoder outside of the event loop, as big payloads take a while"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, decoder, payload)
+
+    async def _get_match_id_page(self, path: str) -> List[str]:
+        """A page of match IDs, refusing anything but a 200 with a list of IDs"""
+        status, page = await self._get(REGION_HOST, "match-v5.ids", path)
+        if status != 200:
+            raise RiotApiError(status, path)
+        if not isinstance(page, list) or not all(isinstance(i, str) for i in page):
+            raise ValueError(f"Riot answered {path} with no list of match IDs")
+        return page
+
+    async def _fetch_match_ids(self, puuid: str, start: int, count: int) -> List[str]:
+        path = f"/lol/match/v5/matches/by-puuid/{puuid}/ids?start={start}&count={count}"
+        return await self._get_match_id_page(path)
+
+    async def _iter_match_ids(
+        self, puuid: str, since: Optional[datetime], limit: Optional[int]
+    ) -> AsyncIterator[str]:
+        """Page through the whole match history of a summoner, newest first
+
+        Args:
+        -----
+            puuid (str): A PUUID of a summoner
+            since (Optional[datetime]): Only matches started after this moment
+            limit (Optional[int]): At most this many IDs
+        """
+        query = f"&startTime={int(since.timestamp())}" if since else ""
+        start = 0
+        while limit is None or start < limit:
+            count = MATCH_IDS_MAX_COUNT
+            if limit is not None:
+                count = min(count, limit - start)
+            path = f"/lol/match/v5/matches/by-puuid/{puuid}/ids?start={start}&count={count}{query}"
+            page = await self._get_match_id_page(path)
+            for match_id in page:
+                yield match_id
+            if not page or len(page) < count:
+                return
+            start += len(page)
+
+    async def _get_match_ids(self, summoners_puuid: str, count: int = 1) -> List[str]:
+        """Get the IDs of the last matches a summoner has played
+
+        Only the IDs newer than the newest one synced before are asked for, and merged
+        with the history kept in the match store. Older IDs are asked for only if the
+        history is shorter than `count`.
+
+        Args:
+        -----
+            summoners_puuid (str): A PUUID of a summoner
+
+            count (int): A number of match ids to be returned. Defaults to 1.
+
+        Returns:
+        --------
+            List[str]: IDs of the last matches played by a summoner, newest first
+        """
+        # Two syncs of one summoner at once would both merge the same new IDs
+        lock = self._sync_locks.setdefault(summoners_puuid, asyncio.Lock())
+        async with lock:
+            return await self._sync_match_ids(summoners_puuid, count)
+
+    async def _sync_match_ids(self, summoners_puuid: str, count: int) -> List[str]:
+        cursor = self.match_store.newest_match_id(summoners_puuid)
+        page_size = MATCH_SYNC_PAGE_SIZE if cursor else min(count, MATCH_IDS_MAX_COUNT)
+        start = 0
+        new_ids: List[str] = []
+
+        while True:
+            page = await self._fetch_match_ids(summoners_puuid, start, page_size)
+            if cursor in page:
+                new_ids += page[: page.index(cursor)]
+                break
+            new_ids += page
+            if len(page) < page_size or (cursor is None and len(new_ids) >= count):
+                if cursor is not None:
+                    # The cursor is gone from riot's history, start it over
+                    self.match_store.forget_match_ids(summoners_puuid)
+                break
+            start += len(page)
+            page_size = min(page_size * 2, MATCH_IDS_MAX_COUNT)
+
+        self.match_store.add_match_ids(summoners_puuid, new_ids)
+        match_ids = self.match_store.match_ids(summoners_puuid, count)
+
+        while len(match_ids) < count:
+            older = await self._fetch_match_ids(
+                summoners_puuid,
+                len(match_ids),
+                min(count - len(match_ids), MATCH_IDS_MAX_COUNT),
+            )
+            if not older:
+                break
+            self.match_store.add_match_ids(summoners_puuid, older, older=True)
+            match_ids += older
+
+        return match_ids
+
+    async def _load_match(self, match_id: str) -> LazyMatch:
+        """Load a match from the store, or from riot if it has not been seen yet"""
+        match = self.match_store.get_match(match_id)
+        if match is None:
+            path = f"/lol/match/v5/matches/{match_id}"
+            status, match = await self._get(REGION_HOST, "match-v5.match", path)
+            if status != 200:
+                raise RiotApiError(status, path)
+            self.match_store.put_match(match_id, match)
+        match = LazyMatch(match)
+        self.match_cache.put(match_id, match)
+        return match
+
+    async def _get_match(self, match_id: str) -> LazyMatch:
+        """Get a match from memory, the store, or from riot if it has not been seen yet
+
+        Matches are returned as lazy views, participants get decoded only when accessed.
+        Every match is loaded once, however many histories of premade members it is in, and
+        the same view serves all of them.
+        """
+        match = self.match_cache.get(match_id)
+        if match is None:
+            match = await self.matches_in_flight.do(
+                match_id, lambda: self._load_match(match_id)
+            )
+        return match
+
+    async def _get_timeline(
+        self, match_id: str, types: Optional[FrozenSet[str]] = None
+    ) -> MatchTimeline:
+        """Get a match timeline from the store, or from riot if it has not been seen yet
+
+        Megabytes of json are decoded, compressed and trimmed here, all of it in an executor.
+
+        Args:
+        -----
+            match_id (str): An ID of a match
+            types (Optional[FrozenSet[str]]): Event types to be kept. Defaults to all of them.
+
+        Returns:
+        --------
+            MatchTimeline: A timeline, with participant frames and the events of given types
+        """
+        loop = asyncio.get_event_loop()
+        timeline = await loop.run_in_executor(
+            None, self.match_store.get_timeline, match_id
+        )
+        if timeline is not None:
+            timeline = await loop.run_in_executor(None, filter_events, timeline, types)
+        else:
+            path = f"/lol/match/v5/matches/{match_id}/timeline"
+            status, timeline = await self._get(
+                REGION_HOST, "match-v5.timeline", path, TimelineReader(types)
+            )
+            if status != 200:
+                raise RiotApiError(status, path)
+            # Only complete timelines are stored, trimmed ones would not serve other callers
+            if types is None:
+                await loop.run_in_executor(
+                    None, self.match_store.put_timeline, match_id, timeline
+                )
+        return await self._decode(decode_match_timeline, timeline)
+
+    async def _get_matches(self, match_ids: List[str]) -> List[LazyMatch]:
+        """Download and decode matches concurrently, in the order of the given IDs"""
+        return list(
+            await asyncio.gather(
+                *(self._bounded(self._get_match, match_id) for match_id in match_ids)
+            )
+        )
+
+    async def _get_timelines(
+        self, match_ids: List[str], types: Optional[FrozenSet[str]] = None
+    ) -> List[MatchTimeline]:
+        """Download and decode timelines concurrently, in the order of the given IDs"""
+        get_timeline = partial(self._get_timeline, types=types)
+        return list(
+            await asyncio.gather(
+                *(self._bounded(get_timeline, match_id) for match_id in match_ids)
+            )
+        )
+
+    async def _store_matches(self, summoners_puuid: str, count: int) -> None:
+        """Make sure the last `count` matches of a summoner are stored, fetching the missing ones"""
+        match_ids = await self._get_match_ids(summoners_puuid, count=count)
+        await self._get_matches(self.match_store.missing_match_ids(match_ids))
+
+    async def _get_match_data(
+        self, summoners_puuid: str, multiple: bool = False
+    ) -> Union[LazyMatch, List[LazyMatch]]:
+        """Get the match data of a summoner with specified PUUID
+
+        Args:
+        -----
+            summoners_puuid (str): A puuid of a summoner for which the matches is to be searched
+
+            multiple (bool): Whether to return more than one match. Defaults to False.
+
+        Returns:
+        --------
+            Union[LazyMatch, List[LazyMatch]]: A match, or last 10 matches, newest first
+        """
+        if not multiple:
+            match_id: str = (await self._get_match_ids(summoners_puuid))[0]
+            return await self._get_match(match_id)
+
+        # riot returns the IDs newest first, and gather keeps that order
+        return await self._get_matches(
+            await self._get_match_ids(summoners_puuid, count=10)
+        )
+
+    async def _get_match_timeline(
+        self,
+        summoners_puuid: str,
+        multiple: bool = False,
+        types: Optional[FrozenSet[str]] = None,
+    ) -> Union[MatchTimeline, List[MatchTimeline]]:
+        """Get timeline of the last match, or matches, of a summoner
+
+        Args:
+        -----
+            summoners_puuid (str): A puuid of a summoner for witch the match is to be searched
+
+            multiple (bool): Whether to return more than one timeline. Defaults to False.
+
+            types (Optional[FrozenSet[str]]): Event types to be kept. Defaults to all of them.
+
+        Returns:
+        -------
+            Union[MatchTimeline, List[MatchTimeline]]: A timeline, or timelines of last 10 matches, newest first
+        """
+        if not multiple:
+            match_id: str = (await self._get_match_ids(summoners_puuid))[0]
+            return await self._get_timeline(match_id, types)
+
+        return await self._get_timelines(
+            await self._get_match_ids(summoners_puuid, count=10), types
+        )
+
+    async def _get_spectator_data(self, summoner_id: int) -> Union[SpectatorData, bool]:
+        """Check if summoner is playing and either return False if not, or dataclass containing current match data
+
+        Args:
+        -----
+            summoner_id (int): An encrypted id of a user
+
+        Raises:
+        -------
+            RiotApiError: On any status other than 200 or 404
+
+        Returns:
+        --------
+            Union[SpectatorData, bool]: Either dataclass containing match data or False if summoner not playing
+        """
+        path = f"/lol/spectator/v4/active-games/by-summoner/{summoner_id}"
+        status, spectator_data = await self._get(
+            PLATFORM_HOST, "spectator-v4.active-games", path
+        )
+
+        if status == 404:
+            return False
+        if status != 200:
+            raise RiotApiError(status, path)
+
+        return SpectatorData.from_dict(spectator_data)
+
+    # -------------------------------------------PUBLIC---------------------------------------------------
+
+    async def summoner_search(self, summoners_name: str) -> Summoner:
+        """Generate a dataclass with all the information on a user
+
+        Args:
+        -----
+            summoners_name (str): Summoner name of a user
+
+        Raises:
+        -------
+            RiotApiError: With status 404 if there is no such summoner, or on riot's errors
+
+        Returns:
+        --------
+            Summoner: A dataclass containing all the information on the user
+        """
+        key = normalise_summoner_name(summoners_name)
+        summoner = self.summoner_cache.get(key)
+        if summoner is not None:
+            return summoner
+
+        path = f"/lol/summoner/v4/summoners/by-name/{summoners_name}"
+        # An empty name would ask for the endpoint itself, not for a summoner
+        if not key:
+            raise RiotApiError(404, path)
+        status, payload = await self._get(PLATFORM_HOST, "summoner-v4.by-name", path)
+        if status != 200:
+            raise RiotApiError(status, path)
+        summoner = Summoner.from_dict(payload)
+        self.summoner_cache.put(key, summoner)
+        # Lets commands resolve the name without asking riot, e.g. the leaderboard
+        self.match_store.put_summoner(summoner.name, summoner.puuid)
+        return summoner
+
+    async def summoners_last_game(
+        self, summoners_name: str, events: Optional[Iterable[str]] = None
+    ) -> Tuple[LazyMatch, MatchTimeline]:
+        """Return all the information in regards to last match of a given player
+
+        Args:
+        ----
+            summoners_name (str): A name of a summoner for which the data is to be searched
+            events (Optional[Iterable[str]]): Types of timeline events to be kept, e.g.
+            ["CHAMPION_KILL"]. Defaults to all of them.
+
+        Returns:
+        -------
+            Tuple[LazyMatch, MatchTimeline]: A tuple containing dataclasses, which have all the information in regards to the match
+        """
+        summoner = await self.summoner_search(summoners_name)
+
+        match, timeline = await asyncio.gather(
+            self._get_match_data(summoner.puuid),
+            self._get_match_timeline(summoner.puuid, types=event_types(events)),
+        )
+        return match, timeline
+
+    async def get_summoner_games(
+        self,
+        summoner_name: str,
+        timelines: bool = True,
+        events: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[LazyMatch], List[MatchTimeline]]:
+        """Return last 10 games that a summoner has played, newest first
+
+        Matches and timelines are fetched concurrently, within the rate limits. Timelines
+        are parsed off the event loop and trimmed right away, so asking only for the events
+        a chart needs keeps ten of them in memory at a fraction of their size.
+
+        Args:
+            summoner_name (str): A name of a summoner, for whom  the games are searched
+            timelines (bool): Whether to fetch timelines of the games as well. Defaults to True.
+            events (Optional[Iterable[str]]): Types of timeline events to be kept, e.g.
+            ["CHAMPION_KILL"]. Defaults to all of them.
+
+        Returns:
+            Tuple[List[LazyMatch], List[MatchTimeline]]: A tuple containing the games, and their timelines
+            (empty if not requested)
+        """
+        summoner = await self.summoner_search(summoner_name)
+        match_ids = await self._get_match_ids(summoner.puuid, count=10)
+
+        if not timelines:
+            return await self._get_matches(match_ids), []
+
+        matches, match_timelines = await asyncio.gather(
+            self._get_matches(match_ids),
+            self._get_timelines(match_ids, event_types(events)),
+        )
+        return matches, match_timelines
+
+    async def newest_match_id(self, puuid: str) -> Optional[str]:
+        """ID of the last match a summoner has played, a cheap check of anything new
+
+        Args:
+        -----
+            puuid (str): A PUUID of a summoner
+
+        Returns:
+        --------
+            Optional[str]: The ID, None if the summoner has not played any match
+        """
+        match_ids = await self._get_match_ids(puuid)
+        return match_ids[0] if match_ids else None
+
+    async def summoner_aggregates(
+        self, summoners_name: str, sync: int = 10
+    ) -> Tuple[Summoner, Optional[SummonerAggregates]]:
+        """Aggregates over all the stored matches of a summoner
+
+        The last `sync` matches are stored first, if they are not yet, so the aggregates are
+        up to date. Stored matches are neither fetched nor read again.
+
+        Args:
+        -----
+            summoners_name (str): A name of a summoner
+            sync (int): How many of the last matches to make sure are stored. Defaults to 10.
+
+        Returns:
+        --------
+            Tuple[Summoner, Optional[SummonerAggregates]]: The summoner and their aggregates,
+            None if they have no stored matches
+        """
+        summoner = await self.summoner_search(summoners_name)
+        await self._store_matches(summoner.puuid, sync)
+        return summoner, self.match_store.aggregates(summoner.puuid)
+
+    async def find_matches(
+        self, summoners_name: str, query: MatchQuery, sync: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Stored matches of a summoner matching a query, see `match_query.py`
+
+        The last `sync` matches are stored first, if they are not yet, so recent games of a
+        summoner no other command has shown are found too.
+
+        Args:
+        -----
+            summoners_name (str): A name of a summoner
+            query (MatchQuery): Filters and columns, its PUUID gets replaced by the summoner's
+            sync (int): How many of the last matches to make sure are stored. Defaults to 10.
+
+        Raises:
+        -------
+            ValueError: On an unknown column or operator of the query
+            RiotApiError: If there is no such summoner, or riot failed to answer
+
+        Returns:
+        --------
+            List[Dict[str, Any]]: The query's columns of every matching game of the summoner
+        """
+        # An invalid query is refused before anything is asked of riot
+        query.sql()
+        puuid = self.match_store.summoner_puuid(summoners_name)
+        if puuid is None:
+            puuid = (await self.summoner_search(summoners_name)).puuid
+        await self._store_matches(puuid, sync)
+        return self.match_store.query(replace(query, puuid=puuid))
+
+    async def iter_matches(
+        self,
+        puuid: str,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        prefetch: int = MATCH_PREFETCH,
+    ) -> AsyncIterator[LazyMatch]:
+        """Stream the match history of a summoner, newest first
+
+        Match IDs are paged through lazily and up to `prefetch` matches are downloaded ahead
+        of the consumer, so long histories are never held in memory all at once.
+
+        Example:
+        --------
+            async for match in api.iter_matches(summoner.puuid, since=season_start):
+                ...
+
+        Args:
+        -----
+            puuid (str): A PUUID of a summoner
+            since (Optional[datetime]): Only matches started after this moment. Defaults to all.
+            limit (Optional[int]): At most this many matches. Defaults to no limit.
+            prefetch (int): How many matches are downloaded ahead of the consumer.
+
+        Yields:
+        -------
+            LazyMatch: Lazily decoded matches, in the order of the history
+        """
+        pending: Deque["asyncio.Future[LazyMatch]"] = deque()
+        try:
+            async for match_id in self._iter_match_ids(puuid, since, limit):
+                pending.append(
+                    asyncio.ensure_future(self._bounded(self._get_match, match_id))
+                )
+                if len(pending) > prefetch:
+                    yield await pending.popleft()
+
+            while pending:
+                yield await pending.popleft()
+        finally:
+            # The consumer stopped early, downloads ahead of it are not needed anymore
+            for future in pending:
+                future.cancel()
+
+    async def summoners_current_game(
+        self, summoners_name: str
+    ) -> Union[SpectatorData, bool]:
+        """Current game data, if available
+
+        Args:
+            summoners_name (str): Name of a summoner to search data for
+
+        Returns:
+            Union[SpectatorData, bool]: Either data of a game, if available or False, if game is not played
+        """
+        summoner = await self.summoner_search(summoners_name)
+        spectator_data = await self._get_spectator_data(summoner.summoner_id)
+
+        if not spectator_data:
+            return False
+
+        return spectator_data
@@ -0,0 +1,188 @@
+"""Chart rendering outside of the event loop.
+
+Rendering a figure takes hundreds of milliseconds of pure CPU, so charts are described by
+plain, picklable `Chart`s and drawn in a pool of worker processes, which keep matplotlib
+imported between renders. Every render builds its own `Figure`, no pyplot state is shared,
+so concurrent commands cannot draw over each other's charts.
+"""
+
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from .cache import TTLCache
+from .constants import CHART_CACHE_SIZE, CHART_RENDER_WORKERS
+
+# The bot is started at import time of main.py, which spawned workers would import again
+_CONTEXT = (
+    multiprocessing.get_context("fork")
+    if "fork" in multiprocessing.get_all_start_methods()
+    else None
+)
+
+
+@dataclass(frozen=True)
+class Series:
+    """Values of a chart, with a matplotlib format string (lines) or color (bars)"""
+
+    values: Tuple[float, ...]
+    style: str = ""
+    color: Optional[str] = None
+    label: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Chart:
+    """A bar or line chart of values over labels, e.g. dates of matches"""
+
+    kind: str
+    labels: Tuple[str, ...]
+    series: Tuple[Series, ...]
+    title: Optional[str] = None
+    ylabel: Optional[str] = None
+
+    @classmethod
+    def bar(
+        cls,
+        labels: Sequence[str],
+        values: Sequence[float],
+        color: str,
+        title: Optional[str] = None,
+        ylabel: Optional[str] = None,
+    ) -> "Chart":
+        return cls(
+            "bar", tuple(labels), (Series(tuple(values), color=color),), title, ylabel
+        )
+
+    @classmethod
+    def line(
+        cls,
+        labels: Sequence[str],
+        series: Sequence[Series],
+        title: Optional[str] = None,
+        ylabel: Optional[str] = None,
+    ) -> "Chart":
+        return cls("line", tuple(labels), tuple(series), title, ylabel)
+
+
+@dataclass(frozen=True)
+class RenderedChart:
+    """A rendered chart along with its embed, as a dict of `discord.Embed.to_dict`"""
+
+    image: bytes
+    embed: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class ChartGrid:
+    """Several charts drawn as subplots of a single figure, row by row"""
+
+    charts: Tuple[Chart, ...]
+    columns: int = 2
+
+
+def _draw(axes, chart: Chart) -> None:
+    """Draw a chart onto matplotlib's axes"""
+    for series in chart.series:
+        if chart.kind == "bar":
+            axes.bar(chart.labels, series.values, color=series.color, width=0.5)
+        else:
+            axes.plot(chart.labels, series.values, series.style, label=series.label)
+
+    if any(series.label for series in chart.series):
+        axes.legend()
+    if chart.title:
+        axes.set_title(chart.title)
+    if chart.ylabel:
+        axes.set_ylabel(chart.ylabel)
+
+
+def render_chart(chart: Union[Chart, ChartGrid]) -> bytes:
+    """Draw a chart, or a grid of them, into PNG bytes, on a figure of its own
+
+    Args:
+    -----
+        chart (Union[Chart, ChartGrid]): A description of the chart, or of several
+
+    Returns:
+    --------
+        bytes: The figure, encoded as PNG
+    """
+    from matplotlib.figure import Figure
+
+    if isinstance(chart, ChartGrid):
+        rows = -(-len(chart.charts) // chart.columns)
+        figure = Figure(figsize=(6.4 * chart.columns, 4.8 * rows), layout="tight")
+        grid = figure.subplots(rows, chart.columns, squeeze=False)
+        for axes, grid_chart in zip(grid.flat, chart.charts):
+            _draw(axes, grid_chart)
+        for axes in grid.flat[len(chart.charts) :]:
+            axes.set_visible(False)
+    else:
+        figure = Figure()
+        _draw(figure.subplots(), chart)
+    # Rotate x labels by 30 degrees
+    figure.autofmt_xdate(ha="right")
+
+    data_stream = io.BytesIO()
+    figure.savefig(data_stream, format="png")
+    return data_stream.getvalue()
+
+
+def _warm_up() -> None:
+    """Import matplotlib and load its fonts in a worker, before the first real render"""
+    render_chart(Chart.bar(["-"], [0], color="black"))
+
+
+class ChartRenderer:
+    """A pool of worker processes rendering charts into PNG bytes"""
+
+    def __init__(self, workers: int = CHART_RENDER_WORKERS) -> None:
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=_CONTEXT
+            )
+        return self._pool
+
+    async def warm_up(self) -> None:
+        """Start all the workers and have them render once, so no command waits for that"""
+        loop = asyncio.get_event_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(self.pool, _warm_up) for _ in range(self.workers))
+        )
+
+    async def render(self, chart: Union[Chart, ChartGrid]) -> bytes:
+        """Render a chart, or a grid of them, in one of the workers, without blocking the event loop
+
+        A worker dying, e.g. killed for memory, breaks the whole pool. It is then replaced
+        by a new one, and the chart is rendered once more.
+        """
+        loop = asyncio.get_event_loop()
+        pool = self.pool
+        try:
+            return await loop.run_in_executor(pool, render_chart, chart)
+        except BrokenProcessPool:
+            # Concurrent renders fail together, only the first one replaces the pool
+            if self._pool is pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+            return await loop.run_in_executor(self.pool, render_chart, chart)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+chart_renderer = ChartRenderer()
+# Rendered charts, invalidated by the summoner's newest match rather than by time
+chart_cache: TTLCache[RenderedChart] = TTLCache(CHART_CACHE_SIZE)
@@ -3,3 +3,45 @@ import os
 RIOT_API_TOKEN = os.getenv("RIOT_API_TOKEN")
 
 TEAM = ["Wrathez", "Anhelion", "Kossano", "AnhelionRealAmI"]
+
+# Routing hosts, every call to riot goes either to the regional or platform one
+REGION_HOST = "europe.api.riotgames.com"
+PLATFORM_HOST = "eun1.api.riotgames.com"
+
+RIOT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 Safari/537.36",
+    "Accept-Language": "en-US,en-GB;q=0.9,en;q=0.8,pl-PL;q=0.7,pl;q=0.6",
+    "Accept-Charset": "application/x-www-form-urlencoded; charset=UTF-8",
+    "Origin": "https://developer.riotgames.com",
+}
+
+MATCH_STORE_PATH = os.getenv("MATCH_STORE_PATH", "match_store.sqlite3")
+
+# How many matches are downloaded at once when fetching a history
+MATCH_FETCH_WORKERS = 5
+
+# Summoners are resolved by name at most once per this many seconds
+SUMMONER_CACHE_TTL = 15 * 60
+SUMMONER_CACHE_SIZE = 256
+
+# Decoded matches kept in memory, premades share them across the histories of their members
+MATCH_CACHE_SIZE = 256
+
+# Size of the first page asked for when syncing match IDs of a known summoner
+MATCH_SYNC_PAGE_SIZE = 5
+# Riot's upper bound for the count of match IDs in a single request
+MATCH_IDS_MAX_COUNT = 100
+# How many matches are downloaded ahead of a consumer streaming a long history
+MATCH_PREFETCH = 10
+
+# Static data of past patches, downloaded from Data Dragon into a directory per version
+DATA_DRAGON_PATH = os.getenv("DATA_DRAGON_PATH", "data_dragon")
+DATA_DRAGON_URL = "https://ddragon.leagueoflegends.com/cdn"
+# Every released version, newest first
+DATA_DRAGON_VERSIONS_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
+DATA_DRAGON_LOCALE = "en_US"
+
+# Worker processes rendering charts, each keeps matplotlib loaded
+CHART_RENDER_WORKERS = 2
+# Rendered charts kept around, until their summoners play another game
+CHART_CACHE_SIZE = 128
@@ -0,0 +1,272 @@
+"""Queries over the stored matches, answered by the store's index of participants.
+
+Every stored match adds a row per participant to `match_participants`, with a projection of
+the columns below. Those rows have secondary indexes on PUUID, champion, queue, start time
+and win, so questions like "games on Jinx in the last 30 days with more than 10 kills" are
+answered by SQLite alone, without reading or decoding a single match.
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .api_dataclasses.match_stats import TEAM_FIRSTS, MatchStats
+
+# Projected columns of a participant of a stored match, with their SQL types
+INDEXED_COLUMNS: Dict[str, str] = {
+    "puuid": "TEXT NOT NULL",
+    "match_id": "TEXT NOT NULL",
+    "champion": "TEXT COLLATE NOCASE",
+    "team_position": "TEXT",
+    "queue_id": "INTEGER",
+    "game_start_timestamp": "INTEGER",
+    "game_duration": "INTEGER",
+    "win": "INTEGER",
+    "kills": "INTEGER",
+    "deaths": "INTEGER",
+    "assists": "INTEGER",
+    "damage": "INTEGER",
+    "gold": "INTEGER",
+    "cs": "INTEGER",
+    "vision_score": "INTEGER",
+    **{name: "INTEGER" for name in TEAM_FIRSTS},
+}
+# Columns with a secondary index, besides the (puuid, match_id) primary key
+SECONDARY_INDEXES: Tuple[str, ...] = (
+    "champion",
+    "queue_id",
+    "game_start_timestamp",
+    "win",
+)
+# Columns of MatchStats some of the projected columns are named differently from
+_SOURCES: Dict[str, str] = {
+    "champion": "champion_name",
+    "damage": "total_damage_dealt_to_champions",
+    "gold": "gold_earned",
+}
+DEFAULT_COLUMNS: Tuple[str, ...] = (
+    "match_id",
+    "game_start_timestamp",
+    "champion",
+    "queue_id",
+    "win",
+    "kills",
+    "deaths",
+    "assists",
+)
+OPERATORS = ("=", "!=", "<", "<=", ">", ">=")
+
+RANKED_QUEUES: Tuple[int, ...] = (420, 440)
+QUEUE_NAMES: Dict[int, str] = {
+    400: "Normal",
+    420: "Solo/Duo",
+    430: "Blind",
+    440: "Flex",
+    450: "ARAM",
+    490: "Quickplay",
+    1700: "Arena",
+}
+
+
+def _value(value: Any) -> Any:
+    """A value of a MatchStats column as SQLite takes it, NaN as NULL"""
+    if isinstance(value, str):
+        return value
+    value = float(value)
+    return None if math.isnan(value) else int(value)
+
+
+def index_rows(match_id: str, stats: MatchStats) -> List[Tuple]:
+    """Rows of `match_participants`, out of `MatchStats.of_participants` of a match
+
+    Args:
+    -----
+        match_id (str): An ID of the match
+        stats (MatchStats): Rows of every participant of the match
+
+    Returns:
+    --------
+        List[Tuple]: A row of INDEXED_COLUMNS for every participant with a PUUID
+    """
+    columns = {"cs": stats["total_minions_killed"] + stats["neutral_minions_killed"]}
+    rows = []
+    for index, record in enumerate(stats.records):
+        if not record["puuid"]:
+            continue
+        values = {"match_id": match_id}
+        for name in INDEXED_COLUMNS:
+            if name in values:
+                continue
+            column = (
+                columns[name] if name in columns else stats[_SOURCES.get(name, name)]
+            )
+            values[name] = _value(column[index])
+        rows.append(tuple(values[name] for name in INDEXED_COLUMNS))
+    return rows
+
+
+@dataclass(frozen=True)
+class MatchQuery:
+    """Filters over the participants of stored matches, and the columns to return
+
+    `filters` are (column, operator, value) triples of any of INDEXED_COLUMNS, e.g.
+    `("kills", ">", 10)` or `("first_dragon", "=", False)`, all of which have to hold.
+    """
+
+    puuid: Optional[str] = None
+    champion: Optional[str] = None
+    queue_ids: Tuple[int, ...] = ()
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    win: Optional[bool] = None
+    filters: Tuple[Tuple[str, str, Any], ...] = ()
+    columns: Tuple[str, ...] = DEFAULT_COLUMNS
+    order_by: str = "game_start_timestamp"
+    descending: bool = True
+    limit: Optional[int] = None
+
+    def _conditions(self) -> List[Tuple[str, str, Any]]:
+        conditions = list(self.filters)
+        if self.puuid is not None:
+            conditions.append(("puuid", "=", self.puuid))
+        if self.champion is not None:
+            conditions.append(("champion", "=", self.champion))
+        if self.since is not None:
+            conditions.append(
+                ("game_start_timestamp", ">=", int(self.since.timestamp() * 1000))
+            )
+        if self.until is not None:
+            conditions.append(
+                ("game_start_timestamp", "<", int(self.until.timestamp() * 1000))
+            )
+        if self.win is not None:
+            conditions.append(("win", "=", self.win))
+        return conditions
+
+    def sql(self) -> Tuple[str, List[Any]]:
+        """The SELECT statement of the query, along with its parameters
+
+        Raises:
+        -------
+            ValueError: On a column, which is not one of INDEXED_COLUMNS, or an unknown operator
+
+        Returns:
+        --------
+            Tuple[str, List[Any]]: The statement and the values of its placeholders
+        """
+        conditions = self._conditions()
+        names = [*self.columns, self.order_by, *(column for column, _, _ in conditions)]
+        unknown = [name for name in names if name not in INDEXED_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        operators = [operator for _, operator, _ in conditions]
+        if any(operator not in OPERATORS for operator in operators):
+            raise ValueError(f"Unknown operator, expected one of {' '.join(OPERATORS)}")
+
+        clauses = [f"{column} {operator} ?" for column, operator, _ in conditions]
+        parameters = [value for _, _, value in conditions]
+        if self.queue_ids:
+            clauses.append(f"queue_id IN ({', '.join('?' for _ in self.queue_ids)})")
+            parameters += self.queue_ids
+
+        statement = f"SELECT {', '.join(self.columns)} FROM match_participants"
+        if clauses:
+            statement += f" WHERE {' AND '.join(clauses)}"
+        statement += f" ORDER BY {self.order_by} {'DESC' if self.descending else 'ASC'}"
+        if self.limit is not None:
+            statement += " LIMIT ?"
+            parameters.append(self.limit)
+        return statement, parameters
+
+
+# Words of the bot's query syntax, e.g. `znajdz vego champion=Jinx dni=30 kills>10 ranked`
+_WORDS: Dict[str, Dict[str, Any]] = {
+    "ranked": {"queue_ids": RANKED_QUEUES},
+    "rankedy": {"queue_ids": RANKED_QUEUES},
+    "aram": {"queue_ids": (450,)},
+    "wygrane": {"win": True},
+    "przegrane": {"win": False},
+}
+_KEYS: Dict[str, str] = {
+    "champ": "champion",
+    "champion": "champion",
+    "postac": "champion",
+    "kolejka": "queue_ids",
+    "queue": "queue_ids",
+    "dni": "days",
+    "days": "days",
+}
+
+
+def _split(word: str) -> Optional[Tuple[str, str, str]]:
+    """A word of a condition split into its column, operator and value"""
+    for operator in sorted(OPERATORS, key=len, reverse=True):
+        column, found, value = word.partition(operator)
+        if found and column and value:
+            return column.lower(), operator, value
+    return None
+
+
+def _convert(column: str, value: str) -> Any:
+    """A value of a condition as the column holds it, text, a flag or a number"""
+    if INDEXED_COLUMNS.get(column, "").startswith("TEXT"):
+        return value
+    lowered = value.lower()
+    if lowered in ("tak", "true", "yes"):
+        return True
+    if lowered in ("nie", "false", "no"):
+        return False
+    try:
+        return float(value) if "." in value else int(value)
+    except ValueError:
+        raise ValueError(f"{column} expects a number, not {value}") from None
+
+
+def parse_query(words: Sequence[str], limit: int = 10) -> Tuple[str, MatchQuery]:
+    """Parse a query of the bot's command into the summoner's name and the query
+
+    Words with an operator are conditions, e.g. `kills>10`, `champion=Jinx`, `dni=30` or
+    `first_dragon=nie`; `ranked`, `aram`, `wygrane` and `przegrane` are shortcuts, and all
+    the other words make up the name of the summoner.
+
+    Args:
+    -----
+        words (Sequence[str]): Words of the command
+        limit (int): At most this many matches. Defaults to 10.
+
+    Raises:
+    -------
+        ValueError: On a value, which is not a number where one is expected, or no name
+
+    Returns:
+    --------
+        Tuple[str, MatchQuery]: The summoner's name and the query, without the PUUID yet
+    """
+    name: List[str] = []
+    options: Dict[str, Any] = {"limit": limit}
+    filters: List[Tuple[str, str, Any]] = []
+    for word in words:
+        if word.lower() in _WORDS:
+            options.update(_WORDS[word.lower()])
+            continue
+
+        condition = _split(word)
+        if condition is None:
+            name.append(word)
+            continue
+
+        column, operator, value = condition
+        key = _KEYS.get(column)
+        if key == "champion" and operator == "=":
+            options["champion"] = value
+        elif key == "queue_ids" and operator == "=":
+            options["queue_ids"] = tuple(int(queue) for queue in value.split(","))
+        elif key == "days":
+            options["since"] = datetime.now() - timedelta(days=float(value))
+        else:
+            filters.append((column, operator, _convert(column, value)))
+
+    if not name:
+        raise ValueError("the name of a summoner is missing")
+    return " ".join(name), MatchQuery(filters=tuple(filters), **options)
@@ -0,0 +1,406 @@
+import json
+import sqlite3
+import zlib
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional
+
+from .api_dataclasses.lazy_match import LazyMatch
+from .api_dataclasses.match_stats import MatchStats
+from .api_dataclasses.summoner import normalise_summoner_name
+from .aggregates import (
+    ChampionRecord,
+    LeaderboardEntry,
+    ParticipantResult,
+    RunningStat,
+    SummonerAggregates,
+    add_result,
+    participant_results,
+)
+from .match_query import INDEXED_COLUMNS, SECONDARY_INDEXES, MatchQuery, index_rows
+
+# Bumped whenever stored data has to be rebuilt, e.g. aggregates of a new stat
+SCHEMA_VERSION = 1
+# Tables rebuilt out of the stored matches, on every bump of SCHEMA_VERSION
+DERIVED_TABLES = (
+    "summoner_aggregates",
+    "summoner_stats",
+    "summoner_champions",
+    "match_participants",
+)
+_PARTICIPANTS_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS match_participants ("
+    + ", ".join(f"{name} {kind}" for name, kind in INDEXED_COLUMNS.items())
+    + ", PRIMARY KEY (puuid, match_id));"
+    + "".join(
+        f"CREATE INDEX IF NOT EXISTS match_participants_by_{name} ON match_participants ({name});"
+        for name in SECONDARY_INDEXES
+    )
+)
+
+
+class MatchStore:
+    """On-disk store of raw match and timeline payloads, keyed by match ID.
+
+    Finished matches never change, hence whatever gets here is never fetched from riot again.
+    Payloads are kept as zlib compressed json. Every stored match also updates the running
+    aggregates (see `aggregates.py`) of all of its participants, and is indexed by their PUUIDs.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+            if version < SCHEMA_VERSION:
+                # Tables derived from the matches are made anew, in case their layout changed
+                for table in DERIVED_TABLES:
+                    self._connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS matches (
+                    match_id TEXT PRIMARY KEY,
+                    data BLOB NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS timelines (
+                    match_id TEXT PRIMARY KEY,
+                    data BLOB NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS summoner_matches (
+                    puuid TEXT NOT NULL,
+                    match_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    PRIMARY KEY (puuid, match_id)
+                );
+                CREATE INDEX IF NOT EXISTS summoner_matches_by_seq
+                    ON summoner_matches (puuid, seq);
+                CREATE TABLE IF NOT EXISTS summoner_aggregates (
+                    puuid TEXT PRIMARY KEY,
+                    games INTEGER NOT NULL,
+                    wins INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS summoner_stats (
+                    puuid TEXT NOT NULL,
+                    stat TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    mean REAL NOT NULL,
+                    m2 REAL NOT NULL,
+                    PRIMARY KEY (puuid, stat)
+                );
+                CREATE TABLE IF NOT EXISTS summoner_champions (
+                    puuid TEXT NOT NULL,
+                    champion TEXT NOT NULL,
+                    games INTEGER NOT NULL,
+                    wins INTEGER NOT NULL,
+                    PRIMARY KEY (puuid, champion)
+                );
+                CREATE TABLE IF NOT EXISTS summoners (
+                    name_key TEXT PRIMARY KEY,
+                    puuid TEXT NOT NULL,
+                    name TEXT NOT NULL
+                );
+                """)
+            self._connection.executescript(_PARTICIPANTS_SCHEMA)
+            if version < SCHEMA_VERSION:
+                self._rebuild()
+                self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    # -------------------------------------------PRIVATE-----------------------------------------------
+
+    @staticmethod
+    def _compress(payload: Dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf8"))
+
+    @staticmethod
+    def _decompress(data: bytes) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(data))
+
+    def _get(self, table: str, match_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT data FROM {table} WHERE match_id = ?", (match_id,)
+            ).fetchone()
+        return self._decompress(row[0]) if row else None
+
+    def _load_aggregates(self, puuid: str) -> Optional[SummonerAggregates]:
+        row = self._connection.execute(
+            "SELECT games, wins FROM summoner_aggregates WHERE puuid = ?", (puuid,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        aggregates = SummonerAggregates(puuid, games=row[0], wins=row[1])
+        for stat, count, mean, m2 in self._connection.execute(
+            "SELECT stat, count, mean, m2 FROM summoner_stats WHERE puuid = ?", (puuid,)
+        ):
+            aggregates.stats[stat] = RunningStat(count, mean, m2)
+        for champion, games, wins in self._connection.execute(
+            "SELECT champion, games, wins FROM summoner_champions WHERE puuid = ?",
+            (puuid,),
+        ):
+            aggregates.champions[champion] = ChampionRecord(games, wins)
+        return aggregates
+
+    def _aggregate(self, results: List[ParticipantResult]) -> None:
+        """Fold results of a newly stored match into the aggregates of its participants"""
+        for result in results:
+            aggregates = add_result(self._load_aggregates(result.puuid), result)
+            champion = aggregates.champions[result.champion]
+            self._connection.execute(
+                "INSERT OR REPLACE INTO summoner_aggregates (puuid, games, wins) VALUES (?, ?, ?)",
+                (result.puuid, aggregates.games, aggregates.wins),
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO summoner_stats (puuid, stat, count, mean, m2) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (result.puuid, name, stat.count, stat.mean, stat.m2)
+                    for name, stat in aggregates.stats.items()
+                    if name in result.values
+                ],
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO summoner_champions (puuid, champion, games, wins) VALUES (?, ?, ?, ?)",
+                (result.puuid, result.champion, champion.games, champion.wins),
+            )
+
+    def _index(self, match_id: str, stats: MatchStats) -> None:
+        """Index a newly stored match by all of its participants, see `match_query.py`"""
+        placeholders = ", ".join("?" for _ in INDEXED_COLUMNS)
+        self._connection.executemany(
+            f"INSERT OR IGNORE INTO match_participants VALUES ({placeholders})",
+            index_rows(match_id, stats),
+        )
+
+    def _rebuild(self) -> None:
+        """Aggregate and index all the stored matches from scratch"""
+        rows = self._connection.execute("SELECT match_id, data FROM matches").fetchall()
+        for match_id, data in rows:
+            stats = MatchStats.of_participants(LazyMatch(self._decompress(data)))
+            self._aggregate(list(participant_results(stats)))
+            self._index(match_id, stats)
+
+    @staticmethod
+    def _check(match_id: str, payload: Any) -> None:
+        """Refuse anything but a match or timeline payload, e.g. a body of riot's error"""
+        if not isinstance(payload, dict) or not {"metadata", "info"} <= payload.keys():
+            raise ValueError(f"Not a payload of {match_id}, not storing it")
+
+    def _put(self, table: str, match_id: str, payload: Dict[str, Any]) -> None:
+        self._check(match_id, payload)
+        data = self._compress(payload)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {table} (match_id, data) VALUES (?, ?)",
+                (match_id, data),
+            )
+
+    # -------------------------------------------PUBLIC---------------------------------------------------
+
+    def get_match(self, match_id: str) -> Optional[Dict[str, Any]]:
+        """Raw payload of a match, or None if it was never stored"""
+        return self._get("matches", match_id)
+
+    def missing_match_ids(self, match_ids: Iterable[str]) -> List[str]:
+        """The given IDs of matches which are not stored yet, in the given order"""
+        match_ids = list(match_ids)
+        if not match_ids:
+            return []
+
+        placeholders = ", ".join("?" for _ in match_ids)
+        with self._lock:
+            stored = {
+                match_id
+                for (match_id,) in self._connection.execute(
+                    f"SELECT match_id FROM matches WHERE match_id IN ({placeholders})",
+                    match_ids,
+                )
+            }
+        return [match_id for match_id in match_ids if match_id not in stored]
+
+    def put_match(self, match_id: str, payload: Dict[str, Any]) -> None:
+        """Store a match if it is new, adding it to the aggregates and index of its participants"""
+        self._check(match_id, payload)
+        data = self._compress(payload)
+        stats = MatchStats.of_participants(LazyMatch(payload))
+        results = list(participant_results(stats))
+        with self._lock, self._connection:
+            inserted = self._connection.execute(
+                "INSERT OR IGNORE INTO matches (match_id, data) VALUES (?, ?)",
+                (match_id, data),
+            ).rowcount
+            if inserted:
+                self._aggregate(results)
+                self._index(match_id, stats)
+
+    def get_timeline(self, match_id: str) -> Optional[Dict[str, Any]]:
+        """Raw payload of a match timeline, or None if it was never stored"""
+        return self._get("timelines", match_id)
+
+    def put_timeline(self, match_id: str, payload: Dict[str, Any]) -> None:
+        self._put("timelines", match_id, payload)
+
+    def newest_match_id(self, puuid: str) -> Optional[str]:
+        """The newest match ID synced for a summoner, or None if nothing was synced yet"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT match_id FROM summoner_matches WHERE puuid = ? ORDER BY seq DESC LIMIT 1",
+                (puuid,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def match_ids(self, puuid: str, count: Optional[int] = None) -> List[str]:
+        """Synced match IDs of a summoner, newest first
+
+        Args:
+        -----
+            puuid (str): A PUUID of a summoner
+            count (Optional[int]): How many IDs to return. Defaults to all of them.
+
+        Returns:
+        --------
+            List[str]: IDs of the matches, newest first
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT match_id FROM summoner_matches WHERE puuid = ? ORDER BY seq DESC LIMIT ?",
+                (puuid, -1 if count is None else count),
+            ).fetchall()
+        return [match_id for (match_id,) in rows]
+
+    def add_match_ids(
+        self, puuid: str, match_ids: List[str], older: bool = False
+    ) -> None:
+        """Merge match IDs into the synced history of a summoner
+
+        Args:
+        -----
+            puuid (str): A PUUID of a summoner
+            match_ids (List[str]): IDs, newest first, as riot returns them
+            older (bool): Whether the IDs are older than the whole history, rather than newer.
+            Defaults to False.
+        """
+        if not match_ids:
+            return
+
+        with self._lock, self._connection:
+            if older:
+                (edge,) = self._connection.execute(
+                    "SELECT COALESCE(MIN(seq), 0) FROM summoner_matches WHERE puuid = ?",
+                    (puuid,),
+                ).fetchone()
+                rows = [
+                    (puuid, match_id, edge - index - 1)
+                    for index, match_id in enumerate(match_ids)
+                ]
+            else:
+                (edge,) = self._connection.execute(
+                    "SELECT COALESCE(MAX(seq), 0) FROM summoner_matches WHERE puuid = ?",
+                    (puuid,),
+                ).fetchone()
+                rows = [
+                    (puuid, match_id, edge + len(match_ids) - index)
+                    for index, match_id in enumerate(match_ids)
+                ]
+            # Newer IDs are in riot's order, which renumbers those already stored too.
+            # Older ones already stored were pushed into the page by new games, and keep
+            # their place.
+            self._connection.executemany(
+                f"INSERT OR {'IGNORE' if older else 'REPLACE'} INTO summoner_matches (puuid, match_id, seq) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def aggregates(self, puuid: str) -> Optional[SummonerAggregates]:
+        """Aggregates over all the stored matches of a summoner, None if there are none"""
+        with self._lock:
+            return self._load_aggregates(puuid)
+
+    def query(self, query: MatchQuery) -> List[Dict[str, Any]]:
+        """Participants of stored matches, found through the index alone
+
+        Args:
+        -----
+            query (MatchQuery): Filters, and the columns to be returned
+
+        Raises:
+        -------
+            ValueError: On an unknown column or operator
+
+        Returns:
+        --------
+            List[Dict[str, Any]]: The query's columns of every matching participant
+        """
+        statement, parameters = query.sql()
+        with self._lock:
+            rows = self._connection.execute(statement, parameters).fetchall()
+        return [dict(zip(query.columns, row)) for row in rows]
+
+    def put_summoner(self, name: str, puuid: str) -> None:
+        """Remember the PUUID of a summoner's name, as riot has just resolved it
+
+        Names are taken from riot's lookups only, never from participants of stored matches.
+        Names are not unique there, so a stranger could take the name of a tracked summoner.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO summoners (name_key, puuid, name) VALUES (?, ?, ?)",
+                (normalise_summoner_name(name), puuid, name),
+            )
+
+    def summoner_puuid(self, name: str) -> Optional[str]:
+        """The PUUID of a summoner's name, None if riot was never asked for it"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT puuid FROM summoners WHERE name_key = ?",
+                (normalise_summoner_name(name),),
+            ).fetchone()
+        return row[0] if row else None
+
+    def leaderboard(
+        self, names: Iterable[str], stats: Iterable[str]
+    ) -> Dict[str, List[LeaderboardEntry]]:
+        """Rank summoners by their average of every given stat, without reading any match
+
+        Args:
+        -----
+            names (Iterable[str]): Names of the summoners to be ranked
+            stats (Iterable[str]): Names of the stats, out of AGGREGATED_STATS
+
+        Returns:
+        --------
+            Dict[str, List[LeaderboardEntry]]: Summoners by every stat, highest average first.
+            Summoners with no stored matches are left out.
+        """
+        names = {normalise_summoner_name(name): name for name in names}
+        stats = list(stats)
+        if not names or not stats:
+            return {stat: [] for stat in stats}
+
+        query = f"""
+            SELECT summoners.name_key, summoner_stats.stat, summoner_aggregates.games,
+                summoner_stats.count, summoner_stats.mean, summoner_stats.m2
+            FROM summoners
+            JOIN summoner_aggregates ON summoner_aggregates.puuid = summoners.puuid
+            JOIN summoner_stats ON summoner_stats.puuid = summoners.puuid
+            WHERE summoners.name_key IN ({", ".join("?" for _ in names)})
+                AND summoner_stats.stat IN ({", ".join("?" for _ in stats)})
+            ORDER BY summoner_stats.mean DESC
+        """
+        with self._lock:
+            rows = self._connection.execute(query, [*names, *stats]).fetchall()
+
+        board: Dict[str, List[LeaderboardEntry]] = {stat: [] for stat in stats}
+        for name_key, stat, games, count, mean, m2 in rows:
+            board[stat].append(
+                LeaderboardEntry(names[name_key], games, RunningStat(count, mean, m2))
+            )
+        return board
+
+    def forget_match_ids(self, puuid: str) -> None:
+        """Drop the synced history of a summoner, so it is synced from scratch"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM summoner_matches WHERE puuid = ?", (puuid,)
+            )
@@ -0,0 +1,199 @@
+import asyncio
+import time
+from threading import Lock
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# Limits of a development key, used until riot tells us the real ones
+DEFAULT_APP_RATE_LIMIT = "20:1,100:120"
+# How many times a request is retried after riot answers with 429
+MAX_RETRIES = 3
+
+
+class RateLimitBucket:
+    """A bucket of `limit` tokens, refilled at once every `window` seconds.
+
+    Riot counts requests in fixed windows starting with the first request,
+    so the bucket mirrors that instead of refilling continuously.
+    """
+
+    __slots__ = ("limit", "window", "used", "window_start")
+
+    def __init__(self, limit: int, window: int) -> None:
+        self.limit = limit
+        self.window = window
+        self.used = 0
+        self.window_start = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now - self.window_start >= self.window:
+            self.window_start = now
+            self.used = 0
+
+    def wait_time(self, now: float) -> float:
+        """Seconds left until a token is available, 0 if there is one right now"""
+        self._refill(now)
+        if self.used < self.limit:
+            return 0.0
+        return self.window_start + self.window - now
+
+    def take(self) -> None:
+        self.used += 1
+
+    def sync(self, count: int, now: float) -> None:
+        """Adopt riot's count of requests, if it saw more of them than we did"""
+        self._refill(now)
+        self.used = max(self.used, count)
+
+
+class RateLimiter:
+    """Central scheduler for all the calls made to riot.
+
+    Keeps a set of buckets for the app limit of every routing region and for the method
+    limit of every endpoint within a region. Callers are never refused; they wait until
+    every bucket they hit has a token. Thread safe.
+    """
+
+    def __init__(self, default_app_limit: str = DEFAULT_APP_RATE_LIMIT) -> None:
+        self.default_app_limit = default_app_limit
+        self._app_buckets: Dict[str, List[RateLimitBucket]] = {}
+        self._method_buckets: Dict[Tuple[str, str], List[RateLimitBucket]] = {}
+        self._blocked_until: Dict[Tuple[str, Optional[str]], float] = {}
+        self._lock = Lock()
+        self._queues: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    # -------------------------------------------PRIVATE-----------------------------------------------
+
+    @staticmethod
+    def _parse(header: str) -> List[Tuple[int, int]]:
+        """Parse riot's limit header, e.g. `20:1,100:120` into [(20, 1), (100, 120)]"""
+        pairs = []
+        for pair in header.split(","):
+            first, second = pair.strip().split(":")
+            pairs.append((int(first), int(second)))
+        return pairs
+
+    @classmethod
+    def _buckets_from_header(cls, header: str) -> List[RateLimitBucket]:
+        return [RateLimitBucket(limit, window) for limit, window in cls._parse(header)]
+
+    @classmethod
+    def _update_buckets(
+        cls,
+        buckets: List[RateLimitBucket],
+        limits: str,
+        counts: Optional[str],
+        now: float,
+    ) -> List[RateLimitBucket]:
+        """Rebuild buckets if riot changed the limits and sync them with riot's counters"""
+        parsed = cls._parse(limits)
+        if [(bucket.limit, bucket.window) for bucket in buckets] != parsed:
+            buckets = [RateLimitBucket(limit, window) for limit, window in parsed]
+        if counts:
+            windows = {bucket.window: bucket for bucket in buckets}
+            for count, window in cls._parse(counts):
+                if window in windows:
+                    windows[window].sync(count, now)
+        return buckets
+
+    def _buckets(self, region: str, method: str) -> List[RateLimitBucket]:
+        if region not in self._app_buckets:
+            self._app_buckets[region] = self._buckets_from_header(
+                self.default_app_limit
+            )
+        return self._app_buckets[region] + self._method_buckets.get(
+            (region, method), []
+        )
+
+    def _reserve(self, region: str, method: str) -> float:
+        """Take a token from every bucket the request hits, if all of them have one
+
+        Returns:
+        --------
+            float: 0 if the request may be sent, otherwise seconds to wait before trying again
+        """
+        with self._lock:
+            now = time.monotonic()
+            blocked_until = max(
+                self._blocked_until.get((region, None), 0.0),
+                self._blocked_until.get((region, method), 0.0),
+            )
+            if blocked_until > now:
+                return blocked_until - now
+
+            buckets = self._buckets(region, method)
+            wait = max((bucket.wait_time(now) for bucket in buckets), default=0.0)
+            if wait > 0:
+                return wait
+
+            for bucket in buckets:
+                bucket.take()
+            return 0.0
+
+    def _queue(self, region: str, method: str) -> asyncio.Lock:
+        """A lock keeping asynchronous callers of an endpoint in the order they came in"""
+        key = (region, method)
+        if key not in self._queues:
+            self._queues[key] = asyncio.Lock()
+        return self._queues[key]
+
+    # -------------------------------------------PUBLIC---------------------------------------------------
+
+    async def acquire(self, region: str, method: str) -> None:
+        """Wait, without blocking the event loop, until a request may be sent
+
+        Args:
+        -----
+            region (str): A routing host the request goes to
+            method (str): A name of the endpoint, limits are kept per endpoint
+        """
+        async with self._queue(region, method):
+            while (wait := self._reserve(region, method)) > 0:
+                await asyncio.sleep(wait)
+
+    def update(self, region: str, method: str, headers: Mapping[str, str]) -> None:
+        """Update the buckets with limits and counts riot returned along a response
+
+        Args:
+        -----
+            region (str): A routing host the request went to
+            method (str): A name of the endpoint
+            headers (Mapping[str, str]): Headers of the response
+        """
+        with self._lock:
+            now = time.monotonic()
+            if "X-App-Rate-Limit" in headers:
+                self._app_buckets[region] = self._update_buckets(
+                    self._app_buckets.get(region, []),
+                    headers["X-App-Rate-Limit"],
+                    headers.get("X-App-Rate-Limit-Count"),
+                    now,
+                )
+            if "X-Method-Rate-Limit" in headers:
+                self._method_buckets[(region, method)] = self._update_buckets(
+                    self._method_buckets.get((region, method), []),
+                    headers["X-Method-Rate-Limit"],
+                    headers.get("X-Method-Rate-Limit-Count"),
+                    now,
+                )
+
+    def backoff(self, region: str, method: str, headers: Mapping[str, str]) -> None:
+        """Hold back requests after riot answered with 429
+
+        A method limit blocks only the endpoint, anything else blocks the whole region.
+
+        Args:
+        -----
+            region (str): A routing host the request went to
+            method (str): A name of the endpoint
+            headers (Mapping[str, str]): Headers of the 429 response
+        """
+        retry_after = float(headers.get("Retry-After", 1))
+        scope = method if headers.get("X-Rate-Limit-Type") == "method" else None
+        with self._lock:
+            key = (region, scope)
+            self._blocked_until[key] = max(
+                self._blocked_until.get(key, 0.0), time.monotonic() + retry_after
+            )
+
+
+riot_rate_limiter = RateLimiter()
@@ -0,0 +1,58 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """A table of in-flight calls, so concurrent callers asking for the same key share one call.
+
+    `hits` counts callers that joined a call already in flight, `misses` the calls actually made.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, "asyncio.Task[T]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    @property
+    def saved_ratio(self) -> float:
+        """Part of all the calls, which were served by a call already in flight"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            "in_flight": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "saved_ratio": self.saved_ratio,
+        }
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Await the call in flight for a key, or start one if there is none
+
+        Args:
+        -----
+            key (Hashable): Key identifying the call, e.g. an url
+            call (Callable[[], Awaitable[T]]): Factory of the awaitable, used only on a miss
+
+        Returns:
+        --------
+            T: Result of the shared call
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # A caller giving up must not cancel the call for everyone else waiting on it
+        return await asyncio.shield(task)
@@ -3,7 +3,8 @@ import discord
 from discord.ext import commands, tasks
 from discord.ext.commands import Bot
 from cogs.riot_api_utilities.api_embed_factory import EmbedFactory, EmbedType
-from cogs.riot_api_utilities.riot_api import RiotApi
+from cogs.riot_api_utilities.async_riot_api import AsyncRiotApi, RiotApiError
+from cogs.riot_api_utilities.chart_renderer import chart_renderer
 from cogs.riot_api_utilities.constants import RIOT_API_TOKEN, TEAM
 
 
@@ -13,11 +14,20 @@ class Tracker(commands.Cog, name='Tracker'):
 
     def __init__(self, bot: Bot) -> None:
         self.bot = bot
-        self.api = RiotApi(RIOT_API_TOKEN)
+        self.api = AsyncRiotApi(RIOT_API_TOKEN)
         self.currently_playing: Dict[str, Any] = {member: "" for member in TEAM}
         self._team.start()
         self.channels = []
 
+    async def cog_load(self) -> None:
+        # Chart workers get started now, rather than by the first chart command
+        await chart_renderer.warm_up()
+
+    async def cog_unload(self) -> None:
+        self._team.cancel()
+        chart_renderer.close()
+        await self.api.close()
+
     @commands.command(
         name="summoner",
         aliases=["szukaj"],
@@ -38,7 +48,7 @@ class Tracker(commands.Cog, name='Tracker'):
         embed_api = EmbedFactory.factory_embed(
             EmbedType.SUMMONER, self.api, summoner_name
         )
-        embed = embed_api.create_embed()
+        embed = await embed_api.create_embed()
         await ctx.send(embed=embed)
 
     async def send_embed_to_all_channels(self, embed: discord.Embed):
@@ -49,9 +59,13 @@ class Tracker(commands.Cog, name='Tracker'):
     async def _team(self):
         """If any of team members are in game ->"""
         for member in TEAM:
-            spectator_data = self.api.summoners_current_game(member)
+            try:
+                spectator_data = await self.api.summoners_current_game(member)
+            except RiotApiError:
+                # Riot failing for one member must not stop the loop, it is asked again in a minute
+                continue
             if spectator_data and spectator_data.game_id != self.currently_playing[member]:
-                embed = EmbedFactory.factory_embed(EmbedType.SPECTATE, self.api, member).create_embed()
+                embed = await EmbedFactory.factory_embed(EmbedType.SPECTATE, self.api, member).create_embed()
                 if embed != None:
                     await self.send_embed_to_all_channels(embed)
                     self.currently_playing[member] = spectator_data.game_id
@@ -59,7 +73,7 @@ class Tracker(commands.Cog, name='Tracker'):
 
             if not spectator_data and self.currently_playing[member]:
                 embed = EmbedFactory.factory_embed(EmbedType.SUMMONER, self.api, member)
-                await self.send_embed_to_all_channels(embed.create_embed())
+                await self.send_embed_to_all_channels(await embed.create_embed())
                 self.currently_playing[member] = ""
                 continue
 
@@ -90,10 +104,8 @@ class Tracker(commands.Cog, name='Tracker'):
         if summoner == "vego":
             summoner = "végø"
         embed_api = EmbedFactory.factory_embed(EmbedType.KDA, self.api, summoner)
-        await ctx.send(
-            embed=embed_api.create_embed(),
-            file=discord.File("test.png", filename="image.png"),
-        )
+        embed = await embed_api.create_embed()
+        await ctx.send(embed=embed, file=embed_api.attachment())
 
     @commands.command(
         name="damage",
@@ -113,10 +125,8 @@ class Tracker(commands.Cog, name='Tracker'):
             summoner = "végø"
 
         embed_api = EmbedFactory.factory_embed(EmbedType.DAMAGE, self.api, summoner)
-        await ctx.send(
-            embed=embed_api.create_embed(),
-            file=discord.File("test.png", filename="image.png"),
-        )
+        embed = await embed_api.create_embed()
+        await ctx.send(embed=embed, file=embed_api.attachment())
 
     @commands.command(
         name="def",
@@ -136,10 +146,8 @@ class Tracker(commands.Cog, name='Tracker'):
             summoner = "végø"
 
         embed_api = EmbedFactory.factory_embed(EmbedType.DEFENSE, self.api, summoner)
-        await ctx.send(
-            embed=embed_api.create_embed(),
-            file=discord.File("test.png", filename="image.png"),
-        )
+        embed = await embed_api.create_embed()
+        await ctx.send(embed=embed, file=embed_api.attachment())
 
     @commands.command(
         name="kp",
@@ -161,10 +169,82 @@ class Tracker(commands.Cog, name='Tracker'):
         embed_api = EmbedFactory.factory_embed(
             EmbedType.KILL_PARTICIPATION, self.api, summoner
         )
-        await ctx.send(
-            embed=embed_api.create_embed(),
-            file=discord.File("test.png", filename="image.png"),
-        )
+        embed = await embed_api.create_embed()
+        await ctx.send(embed=embed, file=embed_api.attachment())
+
+    @commands.command(
+        name="dashboard",
+        description="KDA, damage, defense and kill participation of last 10 games at once",
+        aliases=["panel", "wszystko"],
+    )
+    async def _dashboard(self, ctx, *summoner):
+        """Send an embeded message with all the stats charts from last 10 games
+
+        Args:
+        -----
+            ctx ([type]): A context of a channel
+            summoner (str):  A name of a summoner to search stats for
+        """
+        summoner = " ".join(summoner)
+        if summoner == "vego":
+            summoner = "végø"
+
+        embed_api = EmbedFactory.factory_embed(EmbedType.DASHBOARD, self.api, summoner)
+        embed = await embed_api.create_embed()
+        await ctx.send(embed=embed, file=embed_api.attachment())
+
+    @commands.command(
+        name="summary",
+        description="Averages and most played champions over all stored games",
+        aliases=["podsumowanie"],
+    )
+    async def _summary(self, ctx, *summoner):
+        """Send an embeded message with averages of a summoner over all their stored games
+
+        Args:
+        -----
+            ctx ([type]): A context of a channel
+            summoner (str):  A name of a summoner to search stats for
+        """
+        summoner = " ".join(summoner)
+        if summoner == "vego":
+            summoner = "végø"
+
+        embed_api = EmbedFactory.factory_embed(EmbedType.SUMMARY, self.api, summoner)
+        await ctx.send(embed=await embed_api.create_embed())
+
+    @commands.command(
+        name="leaderboard",
+        description="Ranks the team by KDA, damage, kill participation and vision",
+        aliases=["ranking", "tabela"],
+    )
+    async def _leaderboard(self, ctx):
+        """Send an embeded message ranking the team members over all their stored games
+
+        Args:
+        -----
+            ctx ([type]): A context of a channel
+        """
+        embed_api = EmbedFactory.factory_embed(EmbedType.LEADERBOARD, self.api)
+        await ctx.send(embed=await embed_api.create_embed())
+
+    @commands.command(
+        name="znajdz",
+        description="Finds stored games, e.g. Czerwony znajdz vego champion=Jinx dni=30 kills>10 ranked",
+        aliases=["find", "mecze"],
+    )
+    async def _search(self, ctx, *query):
+        """Send an embeded message with the stored games of a summoner matching a query
+
+        Args:
+        -----
+            ctx ([type]): A context of a channel
+            query (str): A name of a summoner, along with conditions such as `kills>10`
+        """
+        query = " ".join("végø" if word == "vego" else word for word in query)
+
+        embed_api = EmbedFactory.factory_embed(EmbedType.SEARCH, self.api, query)
+        await ctx.send(embed=await embed_api.create_embed())
 
 
 async def setup(bot: Bot):